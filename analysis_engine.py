@@ -12,14 +12,14 @@ from dataclasses import dataclass
 from typing import Dict, Tuple, Optional
 from enum import Enum
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # IST TIMEZONE HANDLING (CRITICAL FOR CLOUD DEPLOYMENT)
 # ═══════════════════════════════════════════════════════════════════════════
 
-IST = pytz.timezone("Asia/Kolkata")
+IST = ZoneInfo("Asia/Kolkata")
 
 def ist_now():
     """Get current datetime in IST (timezone-aware)"""
@@ -624,19 +624,19 @@ def analyze_stock(
     # Determine trade eligibility
     rejection_reasons = []
     
-    if fund_state == FundamentalState.FAIL:
+    if fund_state is FundamentalState.FAIL:
         rejection_reasons.append("Fundamental: FAIL")
     
-    if trend_state == TrendState.ABSENT:
+    if trend_state is TrendState.ABSENT:
         rejection_reasons.append("Trend: ABSENT")
     
-    if entry_state not in [EntryState.OK]:
+    if entry_state is not EntryState.OK:
         rejection_reasons.append(f"Entry: {entry_state.value}")
     
-    if rs_state == RSState.WEAK:
+    if rs_state is RSState.WEAK:
         rejection_reasons.append("RS: WEAK")
     
-    if behavior == Behavior.FAILURE:
+    if behavior is Behavior.FAILURE:
         rejection_reasons.append("Behavior: FAILURE")
     
     trade_eligible = len(rejection_reasons) == 0
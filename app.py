@@ -15,16 +15,19 @@ import plotly.express as px
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from pathlib import Path
-import pytz
+from zoneinfo import ZoneInfo
+import logging
 import os
 import sys
 
+logger = logging.getLogger(__name__)
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # IST TIMEZONE HANDLING (CRITICAL FOR CLOUD DEPLOYMENT)
 # ═══════════════════════════════════════════════════════════════════════════
 
-IST = pytz.timezone("Asia/Kolkata")
+IST = ZoneInfo("Asia/Kolkata")
 
 def ist_now():
     """Get current datetime in IST (timezone-aware)"""
@@ -36,7 +39,7 @@ def ist_today():
 
 # Import our engines
 from analysis_engine import (
-    analyze_stock, AnalysisResult,
+    analyze_stock, analyze_market_state, calculate_ema, AnalysisResult,
     MarketState, FundamentalState, TrendState,
     EntryState, RSState, Behavior
 )
@@ -82,9 +85,21 @@ DEFAULT_UNIVERSE = [
     "TITAN.NS", "ASIANPAINT.NS"
 ]
 
+# Quick-select sector presets (membership tests against the universe)
+IT_SECTOR = frozenset({"TCS.NS", "INFY.NS", "WIPRO.NS", "HCLTECH.NS", "TECHM.NS"})
+BANKING_SECTOR = frozenset({"HDFCBANK.NS", "ICICIBANK.NS", "AXISBANK.NS", "KOTAKBANK.NS", "SBIN.NS"})
+
 
 BENCHMARK_INDEX = "^NSEI"  # NIFTY 50
 
+# Shared chart styling (built once, reused on every rerun)
+CHART_TEMPLATE = 'plotly_dark'
+PRICE_CHART_LAYOUT = dict(
+    height=500,
+    xaxis_rangeslider_visible=False,
+    template=CHART_TEMPLATE
+)
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # DATA LOADING
@@ -102,7 +117,7 @@ def load_stock_data(symbol: str, period: str = "6mo") -> pd.DataFrame:
             
             if df.empty:
                 if attempt < max_retries - 1:
-                    print(f"⚠️ Empty data for {symbol}, retry {attempt + 1}/{max_retries}")
+                    logger.warning("⚠️ Empty data for %s, retry %d/%d", symbol, attempt + 1, max_retries)
                     import time
                     time.sleep(retry_delay)
                     continue
@@ -115,12 +130,12 @@ def load_stock_data(symbol: str, period: str = "6mo") -> pd.DataFrame:
             
             df.columns = [col if isinstance(col, str) else col[0] for col in df.columns]
             
-            print(f"✅ Loaded {len(df)} rows for {symbol}")
+            logger.debug("✅ Loaded %d rows for %s", len(df), symbol)
             return df
             
         except Exception as e:
             if attempt < max_retries - 1:
-                print(f"⚠️ Error loading {symbol} (attempt {attempt + 1}/{max_retries}): {e}")
+                logger.warning("⚠️ Error loading %s (attempt %d/%d): %s", symbol, attempt + 1, max_retries, e)
                 import time
                 time.sleep(retry_delay)
             else:
@@ -133,7 +148,7 @@ def load_stock_data(symbol: str, period: str = "6mo") -> pd.DataFrame:
 @st.cache_data(ttl=3600)
 def load_index_data(symbol: str = BENCHMARK_INDEX) -> pd.DataFrame:
     """Load benchmark index data with fallback"""
-    print(f"📊 Loading index data: {symbol}")
+    logger.debug("📊 Loading index data: %s", symbol)
     
     # Try primary symbol
     df = load_stock_data(symbol)
@@ -141,7 +156,7 @@ def load_index_data(symbol: str = BENCHMARK_INDEX) -> pd.DataFrame:
     if df.empty:
         # Fallback: Try alternate symbol format
         alt_symbol = "^NSEI" if symbol != "^NSEI" else "NIFTY50.NS"
-        print(f"⚠️ Primary index failed, trying fallback: {alt_symbol}")
+        logger.warning("⚠️ Primary index failed, trying fallback: %s", alt_symbol)
         df = load_stock_data(alt_symbol)
     
     if df.empty:
@@ -277,8 +292,9 @@ def main():
             st.sidebar.caption(f"⚠️ {storage.drive_error[:50]}...")
     
     st.sidebar.markdown("---")
-    st.sidebar.caption(f"🕐 IST: {ist_now().strftime('%I:%M %p')}")
-    st.sidebar.caption(f"📅 {ist_today().strftime('%d %b %Y')}")
+    now = ist_now()
+    st.sidebar.caption(f"🕐 IST: {now.strftime('%I:%M %p')}")
+    st.sidebar.caption(f"📅 {now.strftime('%d %b %Y')}")
     
     # Debug: Show module version
     import paper_trade_engine
@@ -287,6 +303,7 @@ def main():
     # Force reload button for debugging
     if st.sidebar.button("🔄 Force Reload Modules", help="Clear cache and reload trade engine"):
         st.cache_data.clear()
+        st.cache_resource.clear()
         # Force reimport
         import importlib
         import sys
@@ -325,10 +342,11 @@ def show_daily_analysis():
         st.title("📈 Daily Market Analysis")
         st.caption("End-of-day analysis • Forward-only testing • No hindsight bias")
     with col2:
+        now = ist_now()
         st.markdown(f"<div style='text-align: right; padding-top: 10px;'>"
                    f"<div style='color: #888; font-size: 0.8rem;'>IST Time</div>"
-                   f"<div style='font-size: 1.2rem; font-weight: 600;'>{ist_now().strftime('%I:%M %p')}</div>"
-                   f"<div style='color: #888; font-size: 0.85rem;'>{ist_today().strftime('%d %b %Y')}</div>"
+                   f"<div style='font-size: 1.2rem; font-weight: 600;'>{now.strftime('%I:%M %p')}</div>"
+                   f"<div style='color: #888; font-size: 0.85rem;'>{now.strftime('%d %b %Y')}</div>"
                    f"</div>", unsafe_allow_html=True)
     
     # Load index data
@@ -339,7 +357,6 @@ def show_daily_analysis():
         return
     
     # Market State with enhanced visual
-    from analysis_engine import analyze_market_state
     market_state = analyze_market_state(index_df)
     
     market_color = "#00CC94" if market_state.value == "RISK-ON" else "#FF5252" if market_state.value == "RISK-OFF" else "#888"
@@ -372,9 +389,9 @@ def show_daily_analysis():
         elif quick_select == "Top 10":
             default_selection = DEFAULT_UNIVERSE[:10]
         elif quick_select == "IT Sector":
-            default_selection = [s for s in DEFAULT_UNIVERSE if s in ["TCS.NS", "INFY.NS", "WIPRO.NS", "HCLTECH.NS", "TECHM.NS"]]
+            default_selection = [s for s in DEFAULT_UNIVERSE if s in IT_SECTOR]
         elif quick_select == "Banking Sector":
-            default_selection = [s for s in DEFAULT_UNIVERSE if s in ["HDFCBANK.NS", "ICICIBANK.NS", "AXISBANK.NS", "KOTAKBANK.NS", "SBIN.NS"]]
+            default_selection = [s for s in DEFAULT_UNIVERSE if s in BANKING_SECTOR]
         elif quick_select == "All Stocks":
             default_selection = DEFAULT_UNIVERSE
         else:
@@ -494,7 +511,10 @@ def analyze_universe(symbols: List[str], index_df: pd.DataFrame, market_state: M
     # Save analysis log
     if analysis_log:
         log_df = pd.DataFrame(analysis_log)
-        st.session_state.storage.save_analysis_log(log_df)
+        if not st.session_state.storage.save_analysis_log(log_df):
+            # Sheets uploads run in the background: this may report an earlier batch
+            error = getattr(st.session_state.storage, 'log_error', None) or "check storage"
+            st.warning(f"⚠️ Analysis log upload failed: {error}")
     
     # Save trades
     trades_df = st.session_state.engine.to_dataframe(include_open=True)
@@ -607,7 +627,7 @@ def analyze_single_stock(symbol: str, index_df: pd.DataFrame, market_state: Mark
         st.write(f"rejection_reasons: {result.rejection_reasons}")
         if st.session_state.engine.open_trades:
             st.caption("Current Open Trades:")
-            for t in st.session_state.engine.open_trades:
+            for t in st.session_state.engine.open_trades.values():
                 st.write(f"- {t.symbol}: {t.trade_id} (entered {t.entry_date.date()})")
     
     # Trade eligibility
@@ -758,7 +778,7 @@ def display_analysis_summary(results: List[AnalysisResult]):
 def display_stock_chart(df: pd.DataFrame, result: AnalysisResult):
     """Display stock chart with EMAs"""
     
-    fig = go.Figure()
+    fig = go.Figure(layout=PRICE_CHART_LAYOUT)
     
     # Candlesticks
     fig.add_trace(go.Candlestick(
@@ -774,7 +794,6 @@ def display_stock_chart(df: pd.DataFrame, result: AnalysisResult):
     
     # EMAs (calculate if not in df)
     if 'EMA20' not in df.columns:
-        from analysis_engine import calculate_ema
         df['EMA20'] = calculate_ema(df['Close'], 20)
         df['EMA50'] = calculate_ema(df['Close'], 50)
     
@@ -792,12 +811,6 @@ def display_stock_chart(df: pd.DataFrame, result: AnalysisResult):
         line=dict(color="orange", width=2)
     ))
     
-    fig.update_layout(
-        height=500,
-        xaxis_rangeslider_visible=False,
-        template='plotly_dark'
-    )
-    
     st.plotly_chart(fig, use_container_width=True)
 
 
@@ -805,6 +818,55 @@ def display_stock_chart(df: pd.DataFrame, result: AnalysisResult):
 # PAGE: PAPER TRADES
 # ═══════════════════════════════════════════════════════════════════════════
 
+OUTCOME_ICONS = {
+    'WIN': '🟢',
+    'LOSS': '🔴',
+    'NO-MOVE': '⚪'
+}
+
+# Metric card HTML (filled per render with str.format_map)
+METRIC_CARD_TEMPLATE = (
+    "<div class='card' style='text-align: center;{border}'>"
+    "<div class='metric-label'>{label}</div>"
+    "<div class='big-metric' style='color: {color};'>{value}</div>"
+    "</div>"
+)
+METRIC_CARD_BORDER = " border-left: 4px solid {};"
+METRIC_ROW_TEMPLATE = (
+    "<div style='display: grid; grid-template-columns: repeat({count}, 1fr); gap: 1rem;'>"
+    "{cards}"
+    "</div>"
+)
+
+# Open trade details, laid out like three columns of st.metric
+OPEN_TRADE_CELL = (
+    "<td style='padding: 6px 12px; border: none;'>"
+    "<div class='metric-label'>{label}</div>"
+    "<div style='font-size: 1.6rem; font-weight: 600;'>{{{field}}}</div>"
+    "</td>"
+)
+OPEN_TRADE_TEMPLATE = (
+    "<table style='width: 100%; border: none;'>"
+    "<tr>"
+    + OPEN_TRADE_CELL.format(label='Entry Price', field='entry_price')
+    + OPEN_TRADE_CELL.format(label='Stop Loss', field='stop_loss')
+    + OPEN_TRADE_CELL.format(label='Holding Days', field='holding_days')
+    + "</tr><tr>"
+    + OPEN_TRADE_CELL.format(label='Shares', field='shares')
+    + OPEN_TRADE_CELL.format(label='Target', field='target')
+    + OPEN_TRADE_CELL.format(label='MFE / MAE', field='excursion')
+    + "</tr>"
+    "</table>"
+    "<div style='color: #888; font-size: 0.85rem;'>Entry Context: {context}</div>"
+)
+
+CLOSED_TRADE_DISPLAY_COLS = (
+    'Outcome_Icon', 'symbol', 'entry_date', 'exit_date',
+    'entry_price', 'exit_price', 'pnl_pct', 'exit_reason',
+    'holding_days', 'mfe', 'mae'
+)
+
+
 def show_paper_trades():
     st.title("📝 Paper Trading Portfolio")
     st.caption("Forward-only simulation • No hindsight • Pure execution tracking")
@@ -816,54 +878,27 @@ def show_paper_trades():
     
     st.markdown("### 📊 Performance Metrics")
     
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
-    with col1:
-        st.markdown(f"""
-        <div class='card' style='text-align: center;'>
-            <div class='metric-label'>Total Trades</div>
-            <div class='big-metric'>{stats['total_trades']}</div>
-        </div>
-        """, unsafe_allow_html=True)
+    win_rate = stats.get('win_rate', 0)
+    wr_color = "#00CC94" if win_rate >= 50 else "#FF9800" if win_rate >= 40 else "#FF5252"
     
-    with col2:
-        st.markdown(f"""
-        <div class='card' style='text-align: center; border-left: 4px solid #4FC3F7;'>
-            <div class='metric-label'>Open</div>
-            <div class='big-metric' style='color: #4FC3F7;'>{stats['open_trades']}</div>
-        </div>
-        """, unsafe_allow_html=True)
+    pnl = stats.get('total_pnl', 0)
+    pnl_color = "#00CC94" if pnl >= 0 else "#FF5252"
+    pnl_sign = "+" if pnl >= 0 else ""
     
-    with col3:
-        wr_color = "#00CC94" if stats.get('win_rate', 0) >= 50 else "#FF9800" if stats.get('win_rate', 0) >= 40 else "#FF5252"
-        st.markdown(f"""
-        <div class='card' style='text-align: center; border-left: 4px solid {wr_color};'>
-            <div class='metric-label'>Win Rate</div>
-            <div class='big-metric' style='color: {wr_color};'>{stats.get('win_rate', 0):.1f}%</div>
-        </div>
-        """, unsafe_allow_html=True)
+    avg_pnl = stats.get('avg_pnl_pct', 0)
+    avg_color = "#00CC94" if avg_pnl >= 0 else "#FF5252"
+    avg_sign = "+" if avg_pnl >= 0 else ""
     
-    with col4:
-        pnl = stats.get('total_pnl', 0)
-        pnl_color = "#00CC94" if pnl >= 0 else "#FF5252"
-        pnl_sign = "+" if pnl >= 0 else ""
-        st.markdown(f"""
-        <div class='card' style='text-align: center; border-left: 4px solid {pnl_color};'>
-            <div class='metric-label'>Total P&L</div>
-            <div class='big-metric' style='color: {pnl_color};'>{pnl_sign}₹{abs(pnl):.0f}</div>
-        </div>
-        """, unsafe_allow_html=True)
+    cards = [
+        METRIC_CARD_TEMPLATE.format_map({'border': '', 'color': 'inherit', 'label': 'Total Trades', 'value': stats['total_trades']}),
+        METRIC_CARD_TEMPLATE.format_map({'border': METRIC_CARD_BORDER.format('#4FC3F7'), 'color': '#4FC3F7', 'label': 'Open', 'value': stats['open_trades']}),
+        METRIC_CARD_TEMPLATE.format_map({'border': METRIC_CARD_BORDER.format(wr_color), 'color': wr_color, 'label': 'Win Rate', 'value': f"{win_rate:.1f}%"}),
+        METRIC_CARD_TEMPLATE.format_map({'border': METRIC_CARD_BORDER.format(pnl_color), 'color': pnl_color, 'label': 'Total P&L', 'value': f"{pnl_sign}₹{abs(pnl):.0f}"}),
+        METRIC_CARD_TEMPLATE.format_map({'border': METRIC_CARD_BORDER.format(avg_color), 'color': avg_color, 'label': 'Avg P&L %', 'value': f"{avg_sign}{avg_pnl:.1f}%"}),
+    ]
     
-    with col5:
-        avg_pnl = stats.get('avg_pnl_pct', 0)
-        avg_color = "#00CC94" if avg_pnl >= 0 else "#FF5252"
-        avg_sign = "+" if avg_pnl >= 0 else ""
-        st.markdown(f"""
-        <div class='card' style='text-align: center; border-left: 4px solid {avg_color};'>
-            <div class='metric-label'>Avg P&L %</div>
-            <div class='big-metric' style='color: {avg_color};'>{avg_sign}{avg_pnl:.1f}%</div>
-        </div>
-        """, unsafe_allow_html=True)
+    # All five cards go out as a single markdown element
+    st.markdown(METRIC_ROW_TEMPLATE.format_map({'count': len(cards), 'cards': ''.join(cards)}), unsafe_allow_html=True)
     
     st.markdown("<br>", unsafe_allow_html=True)
     
@@ -890,51 +925,62 @@ def display_open_trades():
     st.caption("Monitor active trades and update with current market data")
     st.markdown("<br>", unsafe_allow_html=True)
     
-    for trade in engine.open_trades:
+    for trade in engine.open_trades.values():
         with st.expander(f"{trade.symbol} - Entered {trade.entry_date.date()}"):
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric("Entry Price", f"₹{trade.entry_price:.2f}")
-                st.metric("Shares", trade.shares)
+            # One markdown element per trade instead of six metrics + caption
+            st.markdown(OPEN_TRADE_TEMPLATE.format_map({
+                'entry_price': f"₹{trade.entry_price:.2f}",
+                'shares': trade.shares,
+                'stop_loss': f"₹{trade.stop_loss:.2f}",
+                'target': f"₹{trade.target:.2f}",
+                'holding_days': trade.holding_days,
+                'excursion': f"{trade.mfe:.1f}% / {trade.mae:.1f}%",
+                'context': f"{trade.trend_state} | {trade.entry_state} | {trade.rs_state} | {trade.behavior}",
+            }), unsafe_allow_html=True)
+    
+    # Single update control for all open trades
+    st.markdown("<br>", unsafe_allow_html=True)
+    trades_by_id = engine.open_trades
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        selected_id = st.selectbox(
+            "Trade to update",
+            list(trades_by_id),
+            format_func=lambda tid: f"{trades_by_id[tid].symbol} ({tid})",
+            label_visibility="collapsed"
+        )
+    with col2:
+        update_clicked = st.button("🔄 Update Trade", use_container_width=True)
+    
+    # Update trade button with enhanced feedback
+    if update_clicked:
+        trade = trades_by_id[selected_id]
+        with st.spinner(f"Updating {trade.symbol}..."):
+            closed_trade = update_trade_status(trade)
             
-            with col2:
-                st.metric("Stop Loss", f"₹{trade.stop_loss:.2f}")
-                st.metric("Target", f"₹{trade.target:.2f}")
+            # Save immediately after update
+            trades_df = st.session_state.engine.to_dataframe(include_open=True)
+            save_success = st.session_state.storage.save_trades(trades_df)
             
-            with col3:
-                st.metric("Holding Days", trade.holding_days)
-                st.metric("MFE / MAE", f"{trade.mfe:.1f}% / {trade.mae:.1f}%")
+            # Provide clear feedback
+            if closed_trade:
+                st.success(
+                    f"✅ Trade closed: {closed_trade.outcome.value} "
+                    f"via {closed_trade.exit_reason.value}"
+                )
+                st.info(f"📊 Final P&L: {closed_trade.pnl_pct:+.2f}% (₹{closed_trade.pnl:+,.2f})")
+                st.caption(f"📅 Held for {closed_trade.holding_days} days | MFE: {closed_trade.mfe:.1f}% | MAE: {closed_trade.mae:.1f}%")
+            else:
+                st.info(f"📈 Trade {trade.symbol} still open - monitoring continues")
             
-            st.caption(f"Entry Context: {trade.trend_state} | {trade.entry_state} | {trade.rs_state} | {trade.behavior}")
+            if save_success:
+                st.caption("💾 Changes saved to storage")
+            else:
+                st.warning("⚠️ Failed to save to storage (local cache updated)")
             
-            # Update trade button with enhanced feedback
-            if st.button(f"Update {trade.symbol}", key=f"update_{trade.trade_id}"):
-                with st.spinner(f"Updating {trade.symbol}..."):
-                    closed_trade = update_trade_status(trade)
-                    
-                    # Save immediately after update
-                    trades_df = st.session_state.engine.to_dataframe(include_open=True)
-                    save_success = st.session_state.storage.save_trades(trades_df)
-                    
-                    # Provide clear feedback
-                    if closed_trade:
-                        st.success(
-                            f"✅ Trade closed: {closed_trade.outcome.value} "
-                            f"via {closed_trade.exit_reason.value}"
-                        )
-                        st.info(f"📊 Final P&L: {closed_trade.pnl_pct:+.2f}% (₹{closed_trade.pnl:+,.2f})")
-                        st.caption(f"📅 Held for {closed_trade.holding_days} days | MFE: {closed_trade.mfe:.1f}% | MAE: {closed_trade.mae:.1f}%")
-                    else:
-                        st.info(f"📈 Trade {trade.symbol} still open - monitoring continues")
-                    
-                    if save_success:
-                        st.caption("💾 Changes saved to storage")
-                    else:
-                        st.warning("⚠️ Failed to save to storage (local cache updated)")
-                    
-                    # Auto-refresh UI to show updated state
-                    st.rerun()
+            # Auto-refresh UI to show updated state
+            st.rerun()
 
 
 def update_trade_status(trade: PaperTrade) -> Optional[PaperTrade]:
@@ -1013,24 +1059,15 @@ def display_closed_trades():
         st.info("No closed trades yet")
         return
     
+    # Already sorted newest exit first by the engine's cached closed-trade frame
     df = engine.to_dataframe(include_open=False)
     
     # Add visual indicators
-    df['Outcome_Icon'] = df['outcome'].map({
-        'WIN': '🟢',
-        'LOSS': '🔴',
-        'NO-MOVE': '⚪'
-    })
+    df['Outcome_Icon'] = df['outcome'].map(OUTCOME_ICONS)
     
     # Display table
-    display_cols = [
-        'Outcome_Icon', 'symbol', 'entry_date', 'exit_date',
-        'entry_price', 'exit_price', 'pnl_pct', 'exit_reason',
-        'holding_days', 'mfe', 'mae'
-    ]
-    
     st.dataframe(
-        df[display_cols].sort_values('exit_date', ascending=False),
+        df.loc[:, list(CLOSED_TRADE_DISPLAY_COLS)],
         use_container_width=True,
         hide_index=True
     )
@@ -1068,54 +1105,98 @@ def show_analytics():
     with col5:
         st.metric("Win Rate", f"{stats['win_rate']:.1f}%")
     
-    # Charts
+    # Charts (cached per closed-trade set)
+    fingerprint = closed_trades_fingerprint(engine)
+    
     col1, col2 = st.columns(2)
     
     with col1:
-        # Outcome distribution
-        outcome_counts = df['outcome'].value_counts()
-        fig = px.pie(
-            values=outcome_counts.values,
-            names=outcome_counts.index,
-            title="Outcome Distribution"
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(outcome_pie_chart(fingerprint, df), use_container_width=True)
     
     with col2:
-        # Exit reason breakdown
-        exit_counts = df['exit_reason'].value_counts()
-        fig = px.bar(
-            x=exit_counts.index,
-            y=exit_counts.values,
-            title="Exit Reasons"
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(exit_reason_bar_chart(fingerprint, df), use_container_width=True)
+    
+    st.plotly_chart(mfe_mae_scatter_chart(fingerprint, df), use_container_width=True)
     
-    # MFE vs MAE scatter
-    fig = px.scatter(
-        df,
+    st.plotly_chart(holding_period_histogram(fingerprint, df), use_container_width=True)
+
+
+def closed_trades_fingerprint(engine: PaperTradeEngine) -> tuple:
+    """Cheap key identifying the current closed-trade set"""
+    if not engine.closed_trades:
+        return (0, None)
+    return (len(engine.closed_trades), engine.closed_trades[-1].trade_id)
+
+
+# Figures are cached on the fingerprint only; the leading underscore keeps
+# Streamlit from hashing the DataFrame argument on every rerun.
+
+@st.cache_resource(max_entries=16)
+def outcome_pie_chart(fingerprint: tuple, _df: pd.DataFrame):
+    """Outcome distribution pie"""
+    # Enum columns are categoricals: drop the zero counts of unused categories
+    outcome_counts = _df['outcome'].value_counts()
+    outcome_counts = outcome_counts[outcome_counts > 0]
+    return px.pie(
+        values=outcome_counts.values,
+        names=outcome_counts.index,
+        title="Outcome Distribution",
+        template=CHART_TEMPLATE
+    )
+
+
+@st.cache_resource(max_entries=16)
+def exit_reason_bar_chart(fingerprint: tuple, _df: pd.DataFrame):
+    """Exit reason breakdown bar chart"""
+    exit_counts = _df['exit_reason'].value_counts()
+    exit_counts = exit_counts[exit_counts > 0]
+    return px.bar(
+        x=exit_counts.index,
+        y=exit_counts.values,
+        title="Exit Reasons",
+        template=CHART_TEMPLATE
+    )
+
+
+@st.cache_resource(max_entries=16)
+def mfe_mae_scatter_chart(fingerprint: tuple, _df: pd.DataFrame):
+    """MFE vs MAE scatter"""
+    return px.scatter(
+        _df,
         x='mae',
         y='mfe',
         color='outcome',
         title="MFE vs MAE (Max Favorable vs Max Adverse Excursion)",
-        labels={'mae': 'MAE (%)', 'mfe': 'MFE (%)'}
+        labels={'mae': 'MAE (%)', 'mfe': 'MFE (%)'},
+        template=CHART_TEMPLATE
     )
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Holding period stats
-    fig = px.histogram(
-        df,
+
+
+@st.cache_resource(max_entries=16)
+def holding_period_histogram(fingerprint: tuple, _df: pd.DataFrame):
+    """Holding period distribution histogram"""
+    return px.histogram(
+        _df,
         x='holding_days',
         color='outcome',
-        title="Holding Period Distribution"
+        title="Holding Period Distribution",
+        template=CHART_TEMPLATE
     )
-    st.plotly_chart(fig, use_container_width=True)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # PAGE: SETTINGS
 # ═══════════════════════════════════════════════════════════════════════════
 
+def load_synced_analysis_log() -> pd.DataFrame:
+    """Load the analysis log once queued Sheets uploads have landed"""
+    storage = st.session_state.storage
+    flush = getattr(storage, 'flush_analysis_log', None)  # Drive storage saves synchronously
+    if flush is not None and not flush():
+        st.warning(f"⚠️ Analysis log upload failed: {storage.log_error}")
+    return storage.load_analysis_log()
+
+
 def show_settings():
     st.title("⚙️ Settings")
     
@@ -1198,7 +1279,7 @@ def show_settings():
     st.subheader("📊 Fundamental Analysis Log")
     
     # Load analysis log
-    analysis_df = st.session_state.storage.load_analysis_log()
+    analysis_df = load_synced_analysis_log()
     
     if not analysis_df.empty and 'fund_eps_growth' in analysis_df.columns:
         st.caption(f"Showing fundamental checks for {len(analysis_df)} analyzed stocks")
@@ -1239,14 +1320,11 @@ def show_settings():
             
             for col in fund_cols:
                 if col in analysis_df.columns:
-                    # Count string values: 'TRUE', 'FALSE', 'N/A'
-                    total = len(analysis_df)
-                    
-                    # Convert column to string and count
-                    col_values = analysis_df[col].astype(str)
-                    true_count = (col_values == 'TRUE').sum()
-                    false_count = (col_values == 'FALSE').sum()
-                    na_count = (col_values == 'N/A').sum()
+                    # Nullable boolean column: True / False / <NA>
+                    col_values = analysis_df[col]
+                    true_count = int(col_values.sum())
+                    false_count = int((~col_values).sum())
+                    na_count = int(col_values.isna().sum())
                     available = true_count + false_count
                     
                     if available > 0:
@@ -1308,13 +1386,17 @@ def show_settings():
     """)
 
 
+# Above this many analysis log rows, Settings stats are computed on a sample
+FUND_STATS_SAMPLE_SIZE = 20_000
+
+
 def show_fundamental_analysis_section():
     """Display fundamental analysis log with proper None handling"""
 
     st.subheader("📊 Fundamental Analysis Log")
 
     # Load analysis log
-    analysis_df = st.session_state.storage.load_analysis_log()
+    analysis_df = load_synced_analysis_log()
 
     if analysis_df.empty:
         st.info("No analysis log data available. Run stock analysis to generate fundamental logs.")
@@ -1337,16 +1419,14 @@ def show_fundamental_analysis_section():
 
     st.caption(f"Showing fundamental checks for {len(analysis_df)} analyzed stocks")
 
+    # Large logs: estimate the stats from a fixed-seed sample
+    if len(analysis_df) > FUND_STATS_SAMPLE_SIZE and st.sidebar.checkbox("Fast stats (sampled)", value=True):
+        analysis_df = analysis_df.sample(FUND_STATS_SAMPLE_SIZE, random_state=0)
+        st.caption(f"Sampled {FUND_STATS_SAMPLE_SIZE:,} rows for display")
+
     # Calculate statistics
     total_analyzed = len(analysis_df)
 
-    # Convert string values back to booleans for counting
-    def parse_bool_string(value):
-        """Convert CSV string back to boolean or None"""
-        if pd.isna(value) or value in ['None', 'N/A', '']:
-            return None
-        return value in ['True', 'TRUE', 'true']
-
     # Overall fundamental state distribution
     col1, col2, col3 = st.columns(3)
 
@@ -1375,13 +1455,13 @@ def show_fundamental_analysis_section():
     }
 
     for col in fund_cols:
-        # Parse string values
-        col_values = analysis_df[col].apply(parse_bool_string)
+        # Nullable boolean column (converted on load): True / False / <NA>
+        col_values = analysis_df[col]
 
         # Count outcomes
-        true_count = col_values.apply(lambda x: x is True).sum()
-        false_count = col_values.apply(lambda x: x is False).sum()
-        none_count = col_values.apply(lambda x: x is None).sum()
+        true_count = int(col_values.sum())
+        false_count = int((~col_values).sum())
+        none_count = int(col_values.isna().sum())
 
         available = true_count + false_count
 
@@ -62,11 +62,19 @@ def diagnose_fundamental_data():
     # Check values
     print("\n3. Analyzing fundamental check values...")
     
-    for col in existing_cols:
+    # One melt + groupby over all checks instead of a value_counts per column
+    counts = (
+        analysis_df[existing_cols]
+        .melt(var_name='check', value_name='value')
+        .groupby(['check', 'value'], dropna=False)
+        .size()
+        .unstack(fill_value=0)
+        .reindex(existing_cols)
+    )
+    
+    for col, value_counts in counts.iterrows():
         print(f"\n   {col}:")
-        value_counts = analysis_df[col].value_counts()
-        
-        for value, count in value_counts.items():
+        for value, count in value_counts[value_counts > 0].items():
             print(f"      '{value}': {count} ({count/len(analysis_df)*100:.1f}%)")
     
     # Check fundamental_state distribution
@@ -98,10 +106,10 @@ def diagnose_fundamental_data():
     print("INTERPRETATION:")
     print("=" * 80)
     
-    # Count None values
+    # Count None values (loaded as <NA> in the nullable boolean columns)
     none_counts = {}
     for col in existing_cols:
-        none_count = (analysis_df[col] == 'None').sum()
+        none_count = analysis_df[col].isna().sum()
         none_counts[col] = none_count
     
     total_none = sum(none_counts.values())
@@ -6,20 +6,44 @@ Usage:
     python migrate_to_sheets.py
 
 Requirements:
-    pip install gspread google-auth pandas python-dotenv
+    pip install gspread google-auth pandas pyarrow python-dotenv
+
+Optional:
+    pip install requests-cache orjson
 """
 
 import pandas as pd
 import gspread
+from gspread.utils import a1_range_to_grid_range, rowcol_to_a1
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from pathlib import Path
 import json
 import os
+import functools
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 import pickle
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+from storage_manager import StorageConfig, read_frame, FUND_CHECK_COLUMNS
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
 
 load_dotenv()
 
@@ -37,9 +61,11 @@ class MigrationConfig:
     CREDENTIALS_FILE = "credentials.json"
     TOKEN_FILE = "token.json"
     
-    # CSV file paths
-    PAPER_TRADES_CSV = "data/cache/paper_trades.csv"
-    ANALYSIS_LOG_CSV = "data/cache/analysis_log.csv"
+    # Store files written by StorageManager, with the pre-Parquet CSVs as fallback
+    PAPER_TRADES_FILE = StorageConfig.LOCAL_CACHE_DIR / StorageConfig.PAPER_TRADES_FILE
+    ANALYSIS_LOG_FILE = StorageConfig.LOCAL_CACHE_DIR / StorageConfig.ANALYSIS_LOG_FILE
+    PAPER_TRADES_CSV = StorageConfig.LOCAL_CACHE_DIR / StorageConfig.LEGACY_TRADES_FILE
+    ANALYSIS_LOG_CSV = StorageConfig.LOCAL_CACHE_DIR / StorageConfig.LEGACY_ANALYSIS_LOG_FILE
     
     # Sheet names
     TRADES_SHEET = "Paper_Trades"
@@ -49,15 +75,207 @@ class MigrationConfig:
     
     # Share with (optional - email addresses to share the sheet with)
     SHARE_WITH = os.getenv('SHARE_SHEET_WITH', '').split(',')
+    
+    # Upload batching (rows per values.batchUpdate request, parallel requests)
+    UPLOAD_CHUNK_ROWS = 5000
+    UPLOAD_WORKERS = 4
+    SHARE_WORKERS = 8
+    
+    # Retry on rate limits (429), timeouts (408) and server errors (5xx)
+    API_MAX_RETRIES = 8
+    API_MAX_BACKOFF = 60  # seconds
+    
+    # Use the multithreaded PyArrow CSV parser for legacy CSVs (FAST_IO=1)
+    FAST_IO = os.getenv('FAST_IO', '0') == '1'
+    
+    # HTTP cache for OAuth discovery/cert GETs (needs requests-cache)
+    OAUTH_CACHE = "data/cache/oauth_cache"
+    OAUTH_CACHE_TTL = 3600  # seconds
+
+
+# Boolean strings from the CSV analysis log → Sheets representation
+FUND_CHECK_SHEET_VALUES = {
+    'None': 'N/A',
+    'True': 'TRUE', 'TRUE': 'TRUE', 'true': 'TRUE',
+    'False': 'FALSE', 'FALSE': 'FALSE', 'false': 'FALSE',
+}
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# SHEET LAYOUT
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Cell formats shared by all sheets (sent as repeatCell userEnteredFormat)
+HEADER_FORMAT = {
+    'backgroundColor': {'red': 0.2, 'green': 0.3, 'blue': 0.4},
+    'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}},
+    'horizontalAlignment': 'CENTER'
+}
+SECTION_FORMAT = {
+    'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9},
+    'textFormat': {'bold': True}
+}
+STATUS_FORMAT = {'backgroundColor': {'red': 0.8, 'green': 0.9, 'blue': 0.8}}
+BOLD_FORMAT = {'textFormat': {'bold': True}}
+NUMBER_FORMAT = {
+    'horizontalAlignment': 'RIGHT',
+    'numberFormat': {'type': 'NUMBER', 'pattern': '#,##0.00'}
+}
+
+# Column order is resolved once here; rows are built by reindexing to it
+
+# Paper_Trades headers with proper order
+TRADES_HEADERS = [
+    'trade_id', 'symbol', 'entry_date', 'entry_price', 'shares', 
+    'position_value', 'stop_loss', 'target', 'max_holding_days',
+    'trend_state', 'entry_state', 'rs_state', 'behavior', 
+    'market_state', 'fundamental_state',
+    'status', 'exit_date', 'exit_price', 'exit_reason', 'outcome',
+    'pnl', 'pnl_pct', 'holding_days', 'mfe', 'mae', 'notes',
+    'created_at', 'updated_at'
+]
+TRADES_LAST_COL = rowcol_to_a1(1, len(TRADES_HEADERS))[:-1]  # 'AB'
+TRADES_TIMESTAMP_COLS = frozenset(['entry_date', 'exit_date', 'created_at', 'updated_at'])
+TRADES_INT_COLS = frozenset(['shares', 'max_holding_days', 'holding_days'])
+
+ANALYSIS_HEADERS = [
+    'timestamp', 'date', 'symbol', 'market_state', 
+    'fundamental_state', 'fundamental_score',
+    'fund_eps_growth', 'fund_pe_reasonable', 'fund_debt_acceptable',
+    'fund_roe_strong', 'fund_cashflow_positive',
+    'trend_state', 'entry_state', 'rs_state', 'rs_value', 'behavior',
+    'trade_eligible', 'rejection_reasons', 'close', 'rsi', 'consecutive_bars'
+]
+ANALYSIS_LAST_COL = rowcol_to_a1(1, len(ANALYSIS_HEADERS))[:-1]  # 'U'
+ANALYSIS_TIMESTAMP_COLS = frozenset(['timestamp', 'date'])
+
+# Normalize boolean strings from CSV in the fund_* columns
+ANALYSIS_VALUE_MAP = {col: FUND_CHECK_SHEET_VALUES for col in ANALYSIS_HEADERS if col.startswith('fund_')}
+
+
+# Dashboard structure (Value column formulas are parsed as USER_ENTERED)
+DASHBOARD_DATA = (
+    ('Metric', 'Value', '', 'Formula'),
+    ('', '', '', ''),
+    ('TRADE STATISTICS', '', '', ''),
+    ('Total Trades', '=COUNTA(Paper_Trades!A:A)-1', '', 'Count of all trades'),
+    ('Open Trades', '=COUNTIF(Paper_Trades!P:P,"OPEN")', '', 'Currently open positions'),
+    ('Closed Trades', '=COUNTIF(Paper_Trades!P:P,"CLOSED")', '', 'Completed trades'),
+    ('', '', '', ''),
+    ('PERFORMANCE METRICS', '', '', ''),
+    ('Win Count', '=COUNTIF(Paper_Trades!T:T,"WIN")', '', 'Number of wins'),
+    ('Loss Count', '=COUNTIF(Paper_Trades!T:T,"LOSS")', '', 'Number of losses'),
+    ('No-Move Count', '=COUNTIF(Paper_Trades!T:T,"NO-MOVE")', '', 'Breakeven trades'),
+    ('Win Rate %', '=IF(B5=0,0,B9/B5*100)', '', 'Win percentage'),
+    ('', '', '', ''),
+    ('P&L ANALYSIS', '', '', ''),
+    ('Total P&L', '=SUM(Paper_Trades!U:U)', '', 'Sum of all P&L'),
+    ('Avg P&L %', '=AVERAGE(Paper_Trades!V:V)', '', 'Average P&L percentage'),
+    ('Best Trade %', '=MAX(Paper_Trades!V:V)', '', 'Maximum gain'),
+    ('Worst Trade %', '=MIN(Paper_Trades!V:V)', '', 'Maximum loss'),
+    ('Avg Win %', '=AVERAGEIF(Paper_Trades!T:T,"WIN",Paper_Trades!V:V)', '', 'Average winning trade'),
+    ('Avg Loss %', '=AVERAGEIF(Paper_Trades!T:T,"LOSS",Paper_Trades!V:V)', '', 'Average losing trade'),
+    ('', '', '', ''),
+    ('HOLDING PERIOD', '', '', ''),
+    ('Avg Holding Days', '=AVERAGE(Paper_Trades!W:W)', '', 'Average days in trade'),
+    ('', '', '', ''),
+    ('EXIT ANALYSIS', '', '', ''),
+    ('Stop Loss Exits', '=COUNTIF(Paper_Trades!S:S,"STOP_LOSS")', '', ''),
+    ('Target Exits', '=COUNTIF(Paper_Trades!S:S,"TARGET_HIT")', '', ''),
+    ('Behavior Exits', '=COUNTIF(Paper_Trades!S:S,"BEHAVIOR_FAILURE")', '', ''),
+    ('Time Exits', '=COUNTIF(Paper_Trades!S:S,"MAX_HOLDING_DAYS")', '', ''),
+    ('', '', '', ''),
+    ('RISK METRICS', '', '', ''),
+    ('Avg MFE %', '=AVERAGE(Paper_Trades!X:X)', '', 'Avg max favorable excursion'),
+    ('Avg MAE %', '=AVERAGE(Paper_Trades!Y:Y)', '', 'Avg max adverse excursion'),
+    ('', '', '', ''),
+    ('Last Updated', '=NOW()', '', 'Auto-updated timestamp'),
+)
+DASHBOARD_SECTION_ROWS = (3, 8, 14, 22, 25, 31)
+
+# Config sheet contents
+CONFIG_DATA = (
+    ('Parameter', 'Value', 'Description', 'Editable'),
+    ('', '', '', ''),
+    ('TRADING RULES', '', '', ''),
+    ('Position Size', '100000', 'Default position value (₹)', 'YES'),
+    ('Stop Loss %', '5', 'Stop loss percentage', 'NO'),
+    ('Target %', '10', 'Profit target percentage', 'NO'),
+    ('Max Holding Days', '10', 'Maximum days in trade', 'NO'),
+    ('', '', '', ''),
+    ('ENTRY CRITERIA', '', '', ''),
+    ('Fundamental Required', 'PASS or NEUTRAL', 'Minimum fundamental state', 'NO'),
+    ('Trend Required', 'STRONG', 'Required trend state', 'NO'),
+    ('Entry Required', 'OK', 'Required entry state', 'NO'),
+    ('RS Required', 'STRONG', 'Required relative strength', 'NO'),
+    ('Behavior Required', 'CONTINUATION', 'Required behavior state', 'NO'),
+    ('', '', '', ''),
+    ('EXIT PRIORITY', '', '', ''),
+    ('Priority 1', 'STOP_LOSS', '-5%', 'NO'),
+    ('Priority 2', 'TARGET_HIT', '+10%', 'NO'),
+    ('Priority 3', 'BEHAVIOR_FAILURE', 'Distribution detected', 'NO'),
+    ('Priority 4', 'MAX_HOLDING_DAYS', '10 days', 'NO'),
+    ('', '', '', ''),
+    ('SYSTEM INFO', '', '', ''),
+    ('Version', '2.0', 'System version', 'NO'),
+    ('Storage', 'Google Sheets', 'Storage backend', 'NO'),
+    ('Discipline Lock', 'ACTIVE', 'Rules locked until 30 trades', 'NO'),
+    ('', '', '', ''),
+    ('API SETTINGS', '', '', ''),
+    ('API Key', 'SET_IN_APPS_SCRIPT', 'Authentication key', 'YES'),
+    ('Web App URL', 'DEPLOY_APPS_SCRIPT', 'Apps Script endpoint', 'YES'),
+)
+CONFIG_SECTION_ROWS = (3, 9, 16, 22, 27)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # GOOGLE SHEETS CLIENT
 # ═══════════════════════════════════════════════════════════════════════════
 
+class RetryingHTTPClient(gspread.HTTPClient):
+    """gspread HTTP client with exponential backoff (honors Retry-After)"""
+    
+    RETRY_CODES = {408, 429}
+    
+    def request(self, *args, **kwargs):
+        for attempt in range(MigrationConfig.API_MAX_RETRIES + 1):
+            try:
+                return super().request(*args, **kwargs)
+            except gspread.exceptions.APIError as e:
+                code = e.response.status_code
+                if attempt == MigrationConfig.API_MAX_RETRIES or not (code in self.RETRY_CODES or code >= 500):
+                    raise
+                
+                retry_after = e.response.headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    wait = int(retry_after)
+                else:
+                    wait = min(2 ** attempt, MigrationConfig.API_MAX_BACKOFF) + random.random()
+                
+                print(f"⏳ API error {code}, retrying in {wait:.1f}s ({attempt + 1}/{MigrationConfig.API_MAX_RETRIES})")
+                time.sleep(wait)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_token(path: str, mtime_ns: int) -> dict:
+    """Parse the token file; keyed on mtime so a rewritten file is re-read"""
+    with open(path, 'rb') as token:
+        raw = token.read()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def _orjson_response(response, *args, **kwargs):
+    """requests response hook: make response.json() parse with orjson"""
+    response.json = lambda **kwargs: orjson.loads(response.content)
+    return response
+
+
 class SheetsManager:
     """Manager for Google Sheets operations"""
     
+    # Authorized client shared by all instances in this process
+    _CLIENT_CACHE = None
+    
     def __init__(self):
         """Initialize Google Sheets client"""
         self.scopes = [
@@ -67,25 +285,50 @@ class SheetsManager:
         
         self.client = self._authenticate()
         self.spreadsheet = None
+        self.existing_sheets = {}  # title → Worksheet, reused by create_sheet
+        
+        # Value ranges queued by the setup_* methods, written by flush_values()
+        # RAW for plain data, USER_ENTERED where formulas must be parsed
+        self.pending_values = {'RAW': [], 'USER_ENTERED': []}
     
     def _authenticate(self):
         """Authenticate with Google Sheets API using OAuth2 (same as main app)"""
+        cached = SheetsManager._CLIENT_CACHE
+        if cached and not cached.http_client.auth.expired:
+            return cached
+        
         try:
             creds = None
             
-            # Load existing token if available
-            if Path(MigrationConfig.TOKEN_FILE).exists():
+            # Cache OAuth discovery GETs only; token POSTs and Sheets/Drive calls are never cached
+            if REQUESTS_CACHE_AVAILABLE:
+                requests_cache.install_cache(
+                    MigrationConfig.OAUTH_CACHE,
+                    expire_after=requests_cache.DO_NOT_CACHE,
+                    urls_expire_after={
+                        'accounts.google.com': MigrationConfig.OAUTH_CACHE_TTL,
+                        'www.googleapis.com/oauth2': MigrationConfig.OAUTH_CACHE_TTL,
+                    },
+                    allowable_methods=('GET',)
+                )
+            
+            # Load existing token if available (one stat; parse is cached per mtime)
+            try:
+                token_mtime = os.stat(MigrationConfig.TOKEN_FILE).st_mtime_ns
+            except FileNotFoundError:
+                token_mtime = None
+            
+            if token_mtime is not None:
                 print(f"🔐 Loading existing token from {MigrationConfig.TOKEN_FILE}")
-                with open(MigrationConfig.TOKEN_FILE, 'r') as token:
-                    token_data = json.load(token)
-                    creds = Credentials(
-                        token=token_data.get('token'),
-                        refresh_token=token_data.get('refresh_token'),
-                        token_uri=token_data.get('token_uri'),
-                        client_id=token_data.get('client_id'),
-                        client_secret=token_data.get('client_secret'),
-                        scopes=self.scopes
-                    )
+                token_data = _load_token(MigrationConfig.TOKEN_FILE, token_mtime)
+                creds = Credentials(
+                    token=token_data.get('token'),
+                    refresh_token=token_data.get('refresh_token'),
+                    token_uri=token_data.get('token_uri'),
+                    client_id=token_data.get('client_id'),
+                    client_secret=token_data.get('client_secret'),
+                    scopes=self.scopes
+                )
             
             # If no valid credentials, do OAuth flow
             if not creds or not creds.valid:
@@ -112,7 +355,14 @@ class SheetsManager:
                     with open(MigrationConfig.TOKEN_FILE, 'w') as token:
                         token.write(creds.to_json())
             
-            return gspread.authorize(creds)
+            client = gspread.authorize(creds, http_client=RetryingHTTPClient)
+            
+            # Parse API responses with orjson (scoped to this client's session)
+            if ORJSON_AVAILABLE:
+                client.http_client.session.hooks['response'].append(_orjson_response)
+            
+            SheetsManager._CLIENT_CACHE = client
+            return client
         
         except Exception as e:
             print(f"❌ Authentication failed: {e}")
@@ -133,21 +383,36 @@ class SheetsManager:
                     print("❌ Migration cancelled")
                     return None
                 
-                # Clear existing sheets except first one
-                for sheet in self.spreadsheet.worksheets()[1:]:
-                    self.spreadsheet.del_worksheet(sheet)
+                # Clear existing sheets except first one; migration sheets are
+                # kept and cleared in place by create_sheet
+                migration_sheets = {
+                    MigrationConfig.TRADES_SHEET, MigrationConfig.ANALYSIS_SHEET,
+                    MigrationConfig.DASHBOARD_SHEET, MigrationConfig.CONFIG_SHEET
+                }
+                worksheets = self.spreadsheet.worksheets()
+                for sheet in worksheets[1:]:
+                    if sheet.title not in migration_sheets:
+                        self.spreadsheet.del_worksheet(sheet)
+                
+                self.existing_sheets = {
+                    sheet.title: sheet for sheet in worksheets
+                    if sheet.title in migration_sheets
+                }
                 
             except gspread.exceptions.SpreadsheetNotFound:
                 # Create new spreadsheet
                 self.spreadsheet = self.client.create(name)
                 print(f"✅ Created new spreadsheet: {name}")
             
-            # Share with specified users
-            if MigrationConfig.SHARE_WITH:
-                for email in MigrationConfig.SHARE_WITH:
-                    email = email.strip()
-                    if email:
-                        self.spreadsheet.share(email, perm_type='user', role='writer')
+            # Share with specified users (independent Drive calls, sent in parallel)
+            emails = [email.strip() for email in MigrationConfig.SHARE_WITH if email.strip()]
+            if emails:
+                def share(email):
+                    self.spreadsheet.share(email, perm_type='user', role='writer')
+                    return email
+                
+                with ThreadPoolExecutor(max_workers=min(MigrationConfig.SHARE_WORKERS, len(emails))) as executor:
+                    for email in executor.map(share, emails):
                         print(f"📧 Shared with: {email}")
             
             return self.spreadsheet
@@ -161,12 +426,29 @@ class SheetsManager:
         print(f"📄 Creating sheet: {name}")
         
         try:
-            # Check if sheet exists
-            try:
-                sheet = self.spreadsheet.worksheet(name)
-                self.spreadsheet.del_worksheet(sheet)
-            except gspread.exceptions.WorksheetNotFound:
-                pass
+            # Reuse existing sheet: clear values and resize in one batch_update
+            sheet = self.existing_sheets.get(name)
+            if sheet:
+                self.spreadsheet.batch_update({'requests': [
+                    {
+                        'updateCells': {
+                            'range': {'sheetId': sheet.id},
+                            'fields': 'userEnteredValue'
+                        }
+                    },
+                    {
+                        'updateSheetProperties': {
+                            'properties': {
+                                'sheetId': sheet.id,
+                                'gridProperties': {'rowCount': rows, 'columnCount': cols}
+                            },
+                            'fields': 'gridProperties(rowCount,columnCount)'
+                        }
+                    },
+                ]})
+                
+                print(f"✅ Cleared existing sheet: {name}")
+                return sheet
             
             # Create new sheet
             sheet = self.spreadsheet.add_worksheet(
@@ -182,69 +464,168 @@ class SheetsManager:
             print(f"❌ Error creating sheet: {e}")
             raise
     
-    def setup_paper_trades_sheet(self, df: pd.DataFrame):
-        """Setup Paper_Trades sheet with data and formulas"""
+    def _column_range(self, sheet, headers: list, column: str) -> dict:
+        """GridRange covering the data rows (below the header) of one named column"""
+        col_index = headers.index(column)
+        
+        # No endRowIndex: unbounded to the last row of the sheet
+        return {
+            'sheetId': sheet.id,
+            'startRowIndex': 1,
+            'startColumnIndex': col_index,
+            'endColumnIndex': col_index + 1
+        }
+    
+    def _format_request(self, sheet, cell_range, fmt: dict) -> dict:
+        """
+        Build a repeatCell request (batch_update equivalent of sheet.format)
+        
+        cell_range is an A1 string or a GridRange dict; both are resolved
+        locally from sheet.id, with no metadata round-trip.
+        """
+        if isinstance(cell_range, str):
+            cell_range = a1_range_to_grid_range(cell_range, sheet.id)
+        
+        return {
+            'repeatCell': {
+                'range': cell_range,
+                'cell': {'userEnteredFormat': fmt},
+                'fields': f"userEnteredFormat({','.join(fmt)})"
+            }
+        }
+    
+    def _freeze_request(self, sheet, rows: int = 1) -> dict:
+        """Build an updateSheetProperties request (batch_update equivalent of sheet.freeze)"""
+        return {
+            'updateSheetProperties': {
+                'properties': {'sheetId': sheet.id, 'gridProperties': {'frozenRowCount': rows}},
+                'fields': 'gridProperties.frozenRowCount'
+            }
+        }
+    
+    def _queue_values(self, sheet, a1_range: str, values: list, input_option: str = 'RAW'):
+        """Queue a value range for the next flush_values() call"""
+        self.pending_values[input_option].append({
+            'range': f"'{sheet.title}'!{a1_range}",
+            'values': values
+        })
+    
+    def _queue_rows(self, sheet, first_row: int, last_col: str, rows: list):
+        """Queue data rows as ranges of at most UPLOAD_CHUNK_ROWS rows each"""
+        chunk_size = MigrationConfig.UPLOAD_CHUNK_ROWS
+        for i in range(0, len(rows), chunk_size):
+            chunk = rows[i:i + chunk_size]
+            start = first_row + i
+            self._queue_values(sheet, f'A{start}:{last_col}{start + len(chunk) - 1}', chunk)
+    
+    def flush_values(self):
+        """
+        Write all queued value ranges via values.batchUpdate
+        
+        Ranges are grouped into requests of up to UPLOAD_CHUNK_ROWS rows
+        (one request for typical migrations) and large uploads are sent
+        UPLOAD_WORKERS at a time. Ranges never overlap, so order is irrelevant.
+        """
+        for input_option, data in self.pending_values.items():
+            if not data:
+                continue
+            
+            batches = []
+            current, current_rows = [], 0
+            for value_range in data:
+                n_rows = len(value_range['values'])
+                if current and current_rows + n_rows > MigrationConfig.UPLOAD_CHUNK_ROWS:
+                    batches.append(current)
+                    current, current_rows = [], 0
+                current.append(value_range)
+                current_rows += n_rows
+            batches.append(current)
+            
+            def send(batch):
+                return self.spreadsheet.values_batch_update({
+                    'valueInputOption': input_option,
+                    'data': batch
+                })
+            
+            if len(batches) == 1:
+                send(batches[0])
+            else:
+                with ThreadPoolExecutor(max_workers=MigrationConfig.UPLOAD_WORKERS) as executor:
+                    list(executor.map(send, batches))
+            
+            print(f"✅ Wrote {len(data)} ranges in {len(batches)} requests ({input_option})")
+            data.clear()
+    
+    def _frame_to_values(self, df: pd.DataFrame, headers: list, timestamp_cols: frozenset,
+                         value_map: dict = None, int_cols: frozenset = frozenset()) -> list:
+        """
+        Convert DataFrame to sheet rows in header order
+        
+        Missing columns and NaN become '', datetime columns are formatted
+        as strings, and value_map ({column: {old: new}}) is applied before
+        NaN filling. All steps are column-wise; no per-cell Python loop.
+        Rows contain only native Python scalars (int/float/str/bool).
+        """
+        out = df.reindex(columns=headers)
+        
+        # Integer columns read back as float when they contain blanks (10 → 10.0)
+        for col in int_cols.intersection(headers):
+            values = out[col]
+            if pd.api.types.is_float_dtype(values) and (values.dropna() % 1 == 0).all():
+                out[col] = values.astype('Int64')
+        
+        for col in timestamp_cols.intersection(headers):
+            if pd.api.types.is_datetime64_any_dtype(out[col]):
+                out[col] = out[col].dt.strftime('%Y-%m-%d %H:%M:%S')
+        
+        if value_map:
+            out = out.replace(value_map)
+        
+        # astype(object) boxes numpy scalars as Python ints/floats in one pass
+        out = out.astype(object).where(out.notna(), '')
+        return out.values.tolist()
+    
+    def setup_paper_trades_sheet(self, chunks, total_rows: int = 0):
+        """Setup Paper_Trades sheet with data and formulas (chunks: iterable of DataFrames)"""
         print("\n📊 Setting up Paper_Trades sheet...")
         
         sheet = self.create_sheet(
             MigrationConfig.TRADES_SHEET,
-            rows=max(1000, len(df) + 100),
+            rows=max(1000, total_rows + 100),
             cols=30
         )
         
-        # Define headers with proper order
-        headers = [
-            'trade_id', 'symbol', 'entry_date', 'entry_price', 'shares', 
-            'position_value', 'stop_loss', 'target', 'max_holding_days',
-            'trend_state', 'entry_state', 'rs_state', 'behavior', 
-            'market_state', 'fundamental_state',
-            'status', 'exit_date', 'exit_price', 'exit_reason', 'outcome',
-            'pnl', 'pnl_pct', 'holding_days', 'mfe', 'mae', 'notes',
-            'created_at', 'updated_at'
-        ]
+        headers = TRADES_HEADERS
         
         # Add headers
-        sheet.update(values=[headers], range_name='A1:AB1')
-        
-        # Format header row
-        sheet.format('A1:AB1', {
-            'backgroundColor': {'red': 0.2, 'green': 0.3, 'blue': 0.4},
-            'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}},
-            'horizontalAlignment': 'CENTER'
-        })
+        self._queue_values(sheet, f'A1:{TRADES_LAST_COL}1', [headers])
         
-        # Freeze header row
-        sheet.freeze(rows=1)
+        # Formatting is collected and sent in one batch_update at the end
+        requests = [
+            self._format_request(sheet, f'A1:{TRADES_LAST_COL}1', HEADER_FORMAT),
+            self._freeze_request(sheet, rows=1),
+        ]
         
-        # Add data if exists
-        if not df.empty:
-            print(f"📥 Migrating {len(df)} trades...")
-            
-            # Prepare data
-            data = []
-            for _, row in df.iterrows():
-                row_data = []
-                for col in headers:
-                    value = row.get(col, '')
-                    
-                    # Handle timestamps
-                    if col in ['entry_date', 'exit_date', 'created_at', 'updated_at']:
-                        if pd.notna(value):
-                            if isinstance(value, pd.Timestamp):
-                                value = value.strftime('%Y-%m-%d %H:%M:%S')
-                    
-                    # Handle NaN
-                    if pd.isna(value):
-                        value = ''
-                    
-                    row_data.append(value)
-                
-                data.append(row_data)
+        # Add data chunk by chunk; each chunk is written before the next is parsed
+        migrated = 0
+        for df in chunks:
+            # Prepare data (vectorized, in header order)
+            data = self._frame_to_values(
+                df,
+                headers,
+                timestamp_cols=TRADES_TIMESTAMP_COLS,
+                int_cols=TRADES_INT_COLS
+            )
             
             # Batch update
             if data:
-                sheet.update(values=data, range_name=f'A2:AB{len(data)+1}')
-                print(f"✅ Migrated {len(data)} rows")
+                self._queue_rows(sheet, 2 + migrated, TRADES_LAST_COL, data)
+                self.flush_values()
+                migrated += len(data)
+                print(f"📥 Migrated {migrated} trades...")
+        
+        if migrated:
+            print(f"✅ Migrated {migrated} rows")
         
         # Add formulas for auto-calculated columns
         print("⚙️ Adding formulas...")
@@ -254,97 +635,73 @@ class SheetsManager:
         # =IF(R="""", """", (R-D)/D*100) where R=exit_price, D=entry_price
         
         # Add conditional formatting for status
-        sheet.format('P2:P1000', {
-            'backgroundColor': {
-                'red': 0.8,
-                'green': 0.9,
-                'blue': 0.8
+        requests.append(self._format_request(sheet, self._column_range(sheet, headers, 'status'), STATUS_FORMAT))
+        
+        # Add data validation for status column
+        requests.append({
+            'setDataValidation': {
+                'range': self._column_range(sheet, headers, 'status'),
+                'rule': {
+                    'condition': {
+                        'type': 'ONE_OF_LIST',
+                        'values': [{'userEnteredValue': 'OPEN'}, {'userEnteredValue': 'CLOSED'}]
+                    },
+                    'showCustomUi': True,
+                    'strict': True
+                }
             }
         })
         
-        # Add data validation for status column
-        from gspread_formatting import DataValidationRule, BooleanCondition
-        
-        validation_rule = DataValidationRule(
-            BooleanCondition('ONE_OF_LIST', ['OPEN', 'CLOSED']),
-            showCustomUi=True
-        )
+        self.spreadsheet.batch_update({'requests': requests})
         
         print("✅ Paper_Trades sheet setup complete")
         return sheet
     
-    def setup_analysis_log_sheet(self, df: pd.DataFrame):
-        """Setup Analysis_Log sheet"""
+    def setup_analysis_log_sheet(self, chunks, total_rows: int = 0):
+        """Setup Analysis_Log sheet (chunks: iterable of DataFrames)"""
         print("\n📊 Setting up Analysis_Log sheet...")
         
         sheet = self.create_sheet(
             MigrationConfig.ANALYSIS_SHEET,
-            rows=max(2000, len(df) + 100),
+            rows=max(2000, total_rows + 100),
             cols=25
         )
         
-        # Headers
-        headers = [
-            'timestamp', 'date', 'symbol', 'market_state', 
-            'fundamental_state', 'fundamental_score',
-            'fund_eps_growth', 'fund_pe_reasonable', 'fund_debt_acceptable',
-            'fund_roe_strong', 'fund_cashflow_positive',
-            'trend_state', 'entry_state', 'rs_state', 'rs_value', 'behavior',
-            'trade_eligible', 'rejection_reasons', 'close', 'rsi', 'consecutive_bars'
-        ]
+        headers = ANALYSIS_HEADERS
         
         # Add headers
-        sheet.update(values=[headers], range_name='A1:U1')
+        self._queue_values(sheet, f'A1:{ANALYSIS_LAST_COL}1', [headers])
         
-        # Format header
-        sheet.format('A1:U1', {
-            'backgroundColor': {'red': 0.2, 'green': 0.3, 'blue': 0.4},
-            'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}},
-            'horizontalAlignment': 'CENTER'
-        })
+        # Format header and freeze in one batch_update
+        self.spreadsheet.batch_update({'requests': [
+            self._format_request(sheet, f'A1:{ANALYSIS_LAST_COL}1', HEADER_FORMAT),
+            self._freeze_request(sheet, rows=1),
+        ]})
         
-        sheet.freeze(rows=1)
+        migrated_at = datetime.now().isoformat()
         
-        # Add data
-        if not df.empty:
-            print(f"📥 Migrating {len(df)} analysis logs...")
-            
+        # Add data chunk by chunk
+        migrated = 0
+        for df in chunks:
             # Add timestamp column if missing
             if 'timestamp' not in df.columns:
-                df['timestamp'] = datetime.now().isoformat()
+                df['timestamp'] = migrated_at
             
-            data = []
-            for _, row in df.iterrows():
-                row_data = []
-                for col in headers:
-                    value = row.get(col, '')
-                    
-                    # Handle timestamps
-                    if col in ['timestamp', 'date']:
-                        if pd.notna(value):
-                            if isinstance(value, pd.Timestamp):
-                                value = value.strftime('%Y-%m-%d %H:%M:%S')
-                    
-                    # Handle boolean strings from CSV
-                    if col.startswith('fund_'):
-                        if value == 'None':
-                            value = 'N/A'
-                        elif value in ['True', 'TRUE', 'true']:
-                            value = 'TRUE'
-                        elif value in ['False', 'FALSE', 'false']:
-                            value = 'FALSE'
-                    
-                    # Handle NaN
-                    if pd.isna(value):
-                        value = ''
-                    
-                    row_data.append(value)
-                
-                data.append(row_data)
+            data = self._frame_to_values(
+                df,
+                headers,
+                timestamp_cols=ANALYSIS_TIMESTAMP_COLS,
+                value_map=ANALYSIS_VALUE_MAP
+            )
             
             if data:
-                sheet.update(values=data, range_name=f'A2:U{len(data)+1}')
-                print(f"✅ Migrated {len(data)} rows")
+                self._queue_rows(sheet, 2 + migrated, ANALYSIS_LAST_COL, data)
+                self.flush_values()
+                migrated += len(data)
+                print(f"📥 Migrated {migrated} analysis logs...")
+        
+        if migrated:
+            print(f"✅ Migrated {migrated} rows")
         
         print("✅ Analysis_Log sheet setup complete")
         return sheet
@@ -355,82 +712,35 @@ class SheetsManager:
         
         sheet = self.create_sheet(MigrationConfig.DASHBOARD_SHEET, rows=50, cols=10)
         
-        # Dashboard structure
-        dashboard_data = [
-            ['Metric', 'Value', '', 'Formula'],
-            ['', '', '', ''],
-            ['TRADE STATISTICS', '', '', ''],
-            ['Total Trades', '=COUNTA(Paper_Trades!A:A)-1', '', 'Count of all trades'],
-            ['Open Trades', '=COUNTIF(Paper_Trades!P:P,"OPEN")', '', 'Currently open positions'],
-            ['Closed Trades', '=COUNTIF(Paper_Trades!P:P,"CLOSED")', '', 'Completed trades'],
-            ['', '', '', ''],
-            ['PERFORMANCE METRICS', '', '', ''],
-            ['Win Count', '=COUNTIF(Paper_Trades!T:T,"WIN")', '', 'Number of wins'],
-            ['Loss Count', '=COUNTIF(Paper_Trades!T:T,"LOSS")', '', 'Number of losses'],
-            ['No-Move Count', '=COUNTIF(Paper_Trades!T:T,"NO-MOVE")', '', 'Breakeven trades'],
-            ['Win Rate %', '=IF(B5=0,0,B9/B5*100)', '', 'Win percentage'],
-            ['', '', '', ''],
-            ['P&L ANALYSIS', '', '', ''],
-            ['Total P&L', '=SUM(Paper_Trades!U:U)', '', 'Sum of all P&L'],
-            ['Avg P&L %', '=AVERAGE(Paper_Trades!V:V)', '', 'Average P&L percentage'],
-            ['Best Trade %', '=MAX(Paper_Trades!V:V)', '', 'Maximum gain'],
-            ['Worst Trade %', '=MIN(Paper_Trades!V:V)', '', 'Maximum loss'],
-            ['Avg Win %', '=AVERAGEIF(Paper_Trades!T:T,"WIN",Paper_Trades!V:V)', '', 'Average winning trade'],
-            ['Avg Loss %', '=AVERAGEIF(Paper_Trades!T:T,"LOSS",Paper_Trades!V:V)', '', 'Average losing trade'],
-            ['', '', '', ''],
-            ['HOLDING PERIOD', '', '', ''],
-            ['Avg Holding Days', '=AVERAGE(Paper_Trades!W:W)', '', 'Average days in trade'],
-            ['', '', '', ''],
-            ['EXIT ANALYSIS', '', '', ''],
-            ['Stop Loss Exits', '=COUNTIF(Paper_Trades!S:S,"STOP_LOSS")', '', ''],
-            ['Target Exits', '=COUNTIF(Paper_Trades!S:S,"TARGET_HIT")', '', ''],
-            ['Behavior Exits', '=COUNTIF(Paper_Trades!S:S,"BEHAVIOR_FAILURE")', '', ''],
-            ['Time Exits', '=COUNTIF(Paper_Trades!S:S,"MAX_HOLDING_DAYS")', '', ''],
-            ['', '', '', ''],
-            ['RISK METRICS', '', '', ''],
-            ['Avg MFE %', '=AVERAGE(Paper_Trades!X:X)', '', 'Avg max favorable excursion'],
-            ['Avg MAE %', '=AVERAGE(Paper_Trades!Y:Y)', '', 'Avg max adverse excursion'],
-            ['', '', '', ''],
-            ['Last Updated', f'=NOW()', '', 'Auto-updated timestamp'],
-        ]
-        
         # Write dashboard
-        sheet.update(values=dashboard_data, range_name=f'A1:D{len(dashboard_data)}')
+        self._queue_values(sheet, f'A1:D{len(DASHBOARD_DATA)}', DASHBOARD_DATA, input_option='USER_ENTERED')
         
         # Format dashboard
-        sheet.format('A1:D1', {
-            'backgroundColor': {'red': 0.2, 'green': 0.3, 'blue': 0.4},
-            'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}},
-            'horizontalAlignment': 'CENTER'
-        })
+        requests = [self._format_request(sheet, 'A1:D1', HEADER_FORMAT)]
         
         # Format section headers
-        section_rows = [3, 8, 14, 22, 25, 30]
-        for row in section_rows:
-            sheet.format(f'A{row}:D{row}', {
-                'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9},
-                'textFormat': {'bold': True}
-            })
+        for row in DASHBOARD_SECTION_ROWS:
+            requests.append(self._format_request(sheet, f'A{row}:D{row}', SECTION_FORMAT))
         
         # Format metrics column
-        sheet.format('A:A', {'textFormat': {'bold': True}})
+        requests.append(self._format_request(sheet, 'A:A', BOLD_FORMAT))
         
         # Format values column (numbers)
-        sheet.format('B:B', {
-            'horizontalAlignment': 'RIGHT',
-            'numberFormat': {'type': 'NUMBER', 'pattern': '#,##0.00'}
-        })
+        requests.append(self._format_request(sheet, 'B:B', NUMBER_FORMAT))
         
         # Freeze header
-        sheet.freeze(rows=1)
+        requests.append(self._freeze_request(sheet, rows=1))
         
         # Set column widths
-        sheet.update_dimensions_request = {
+        requests.append({
             'updateDimensionProperties': {
-                'range': {'dimension': 'COLUMNS', 'startIndex': 0, 'endIndex': 1},
-                'properties': {'pixelSize': 200}
+                'range': {'sheetId': sheet.id, 'dimension': 'COLUMNS', 'startIndex': 0, 'endIndex': 1},
+                'properties': {'pixelSize': 200},
+                'fields': 'pixelSize'
             }
-        }
+        })
+        
+        self.spreadsheet.batch_update({'requests': requests})
         
         print("✅ Dashboard sheet setup complete")
         return sheet
@@ -441,58 +751,84 @@ class SheetsManager:
         
         sheet = self.create_sheet(MigrationConfig.CONFIG_SHEET, rows=30, cols=5)
         
-        config_data = [
-            ['Parameter', 'Value', 'Description', 'Editable'],
-            ['', '', '', ''],
-            ['TRADING RULES', '', '', ''],
-            ['Position Size', '100000', 'Default position value (₹)', 'YES'],
-            ['Stop Loss %', '5', 'Stop loss percentage', 'NO'],
-            ['Target %', '10', 'Profit target percentage', 'NO'],
-            ['Max Holding Days', '10', 'Maximum days in trade', 'NO'],
-            ['', '', '', ''],
-            ['ENTRY CRITERIA', '', '', ''],
-            ['Fundamental Required', 'PASS or NEUTRAL', 'Minimum fundamental state', 'NO'],
-            ['Trend Required', 'STRONG', 'Required trend state', 'NO'],
-            ['Entry Required', 'OK', 'Required entry state', 'NO'],
-            ['RS Required', 'STRONG', 'Required relative strength', 'NO'],
-            ['Behavior Required', 'CONTINUATION', 'Required behavior state', 'NO'],
-            ['', '', '', ''],
-            ['EXIT PRIORITY', '', '', ''],
-            ['Priority 1', 'STOP_LOSS', '-5%', 'NO'],
-            ['Priority 2', 'TARGET_HIT', '+10%', 'NO'],
-            ['Priority 3', 'BEHAVIOR_FAILURE', 'Distribution detected', 'NO'],
-            ['Priority 4', 'MAX_HOLDING_DAYS', '10 days', 'NO'],
-            ['', '', '', ''],
-            ['SYSTEM INFO', '', '', ''],
-            ['Version', '2.0', 'System version', 'NO'],
-            ['Storage', 'Google Sheets', 'Storage backend', 'NO'],
-            ['Discipline Lock', 'ACTIVE', 'Rules locked until 30 trades', 'NO'],
-            ['', '', '', ''],
-            ['API SETTINGS', '', '', ''],
-            ['API Key', 'SET_IN_APPS_SCRIPT', 'Authentication key', 'YES'],
-            ['Web App URL', 'DEPLOY_APPS_SCRIPT', 'Apps Script endpoint', 'YES'],
-        ]
-        
-        sheet.update(values=config_data, range_name=f'A1:D{len(config_data)}')
+        self._queue_values(sheet, f'A1:D{len(CONFIG_DATA)}', CONFIG_DATA)
         
         # Format
-        sheet.format('A1:D1', {
-            'backgroundColor': {'red': 0.2, 'green': 0.3, 'blue': 0.4},
-            'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}},
-            'horizontalAlignment': 'CENTER'
-        })
+        requests = [self._format_request(sheet, 'A1:D1', HEADER_FORMAT)]
         
-        section_rows = [3, 9, 16, 22, 27]
-        for row in section_rows:
-            sheet.format(f'A{row}:D{row}', {
-                'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9},
-                'textFormat': {'bold': True}
-            })
+        for row in CONFIG_SECTION_ROWS:
+            requests.append(self._format_request(sheet, f'A{row}:D{row}', SECTION_FORMAT))
+        
+        self.spreadsheet.batch_update({'requests': requests})
         
         print("✅ Config sheet setup complete")
         return sheet
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# DATA LOADING
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Kept as strings so the sheet receives exactly what the CSV holds
+# (PyArrow would otherwise infer offset timestamps and normalize them to UTC)
+CSV_TIMESTAMP_COLUMNS = TRADES_TIMESTAMP_COLS | ANALYSIS_TIMESTAMP_COLS
+
+
+def count_csv_rows(path: str) -> int:
+    """Count data rows without parsing (used to size the sheet up front)"""
+    with open(path, 'rb') as f:
+        return max(sum(1 for _ in f) - 1, 0)
+
+
+def read_csv_chunks(path: str, chunk_rows: int = MigrationConfig.UPLOAD_CHUNK_ROWS):
+    """
+    Yield a CSV file as DataFrames of at most chunk_rows rows
+    
+    With FAST_IO the file is parsed once into a columnar Arrow table and
+    converted to pandas one slice at a time; otherwise pandas streams it.
+    """
+    if MigrationConfig.FAST_IO:
+        table = pa_csv.read_csv(
+            path,
+            convert_options=pa_csv.ConvertOptions(
+                column_types={col: pa.string() for col in CSV_TIMESTAMP_COLUMNS},
+                strings_can_be_null=True
+            )
+        )
+        for start in range(0, table.num_rows, chunk_rows):
+            yield table.slice(start, chunk_rows).to_pandas()
+        return
+    
+    yield from pd.read_csv(path, chunksize=chunk_rows)
+
+
+def frame_chunks(df: pd.DataFrame, chunk_rows: int = MigrationConfig.UPLOAD_CHUNK_ROWS):
+    """
+    Yield a Parquet store frame in slices of at most chunk_rows rows
+    
+    Nullable boolean fund_* columns are rendered as the CSV strings
+    ('True'/'False'/'None') so FUND_CHECK_SHEET_VALUES serves both sources.
+    """
+    for col in FUND_CHECK_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(object).where(df[col].notna(), None).map(str)
+    
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def load_source(store_path: Path, csv_path: Path):
+    """(chunks, row count, path) of the store file, else its legacy CSV, else empty"""
+    if store_path.exists():
+        df = read_frame(store_path)
+        return frame_chunks(df), len(df), store_path
+    
+    if csv_path.exists():
+        return read_csv_chunks(csv_path), count_csv_rows(csv_path), csv_path
+    
+    return [], 0, None
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # MAIN MIGRATION FUNCTION
 # ═══════════════════════════════════════════════════════════════════════════
@@ -505,23 +841,25 @@ def migrate_csv_to_sheets():
     print("="*80)
     print()
     
-    # Step 1: Load CSV files
-    print("📂 Loading CSV files...")
-    
-    trades_df = pd.DataFrame()
-    analysis_df = pd.DataFrame()
+    # Step 1: Load store files
+    print("📂 Loading store files...")
     
-    if Path(MigrationConfig.PAPER_TRADES_CSV).exists():
-        trades_df = pd.read_csv(MigrationConfig.PAPER_TRADES_CSV)
-        print(f"✅ Loaded {len(trades_df)} trades from {MigrationConfig.PAPER_TRADES_CSV}")
+    # Parquet stores are read whole; legacy CSVs are only counted and streamed
+    trades_chunks, trades_rows, trades_source = load_source(
+        MigrationConfig.PAPER_TRADES_FILE, MigrationConfig.PAPER_TRADES_CSV
+    )
+    if trades_source:
+        print(f"✅ Found {trades_rows} trades in {trades_source}")
     else:
-        print(f"⚠️  No trades CSV found at {MigrationConfig.PAPER_TRADES_CSV}")
+        print(f"⚠️  No trades found at {MigrationConfig.PAPER_TRADES_FILE}")
     
-    if Path(MigrationConfig.ANALYSIS_LOG_CSV).exists():
-        analysis_df = pd.read_csv(MigrationConfig.ANALYSIS_LOG_CSV)
-        print(f"✅ Loaded {len(analysis_df)} analysis logs from {MigrationConfig.ANALYSIS_LOG_CSV}")
+    analysis_chunks, analysis_rows, analysis_source = load_source(
+        MigrationConfig.ANALYSIS_LOG_FILE, MigrationConfig.ANALYSIS_LOG_CSV
+    )
+    if analysis_source:
+        print(f"✅ Found {analysis_rows} analysis logs in {analysis_source}")
     else:
-        print(f"⚠️  No analysis log CSV found at {MigrationConfig.ANALYSIS_LOG_CSV}")
+        print(f"⚠️  No analysis log found at {MigrationConfig.ANALYSIS_LOG_FILE}")
     
     print()
     
@@ -538,12 +876,16 @@ def migrate_csv_to_sheets():
     print()
     
     # Step 4: Setup sheets
-    manager.setup_paper_trades_sheet(trades_df)
-    manager.setup_analysis_log_sheet(analysis_df)
+    manager.setup_paper_trades_sheet(trades_chunks, trades_rows)
+    manager.setup_analysis_log_sheet(analysis_chunks, analysis_rows)
     manager.setup_dashboard_sheet()
     manager.setup_config_sheet()
     
-    # Step 5: Print success
+    # Step 5: Write all sheet values
+    print("\n📤 Writing sheet values...")
+    manager.flush_values()
+    
+    # Step 6: Print success
     print()
     print("="*80)
     print("✅ MIGRATION COMPLETE!")
@@ -561,8 +903,8 @@ def migrate_csv_to_sheets():
     print(f"   6. Update your Python code to use SheetsStorageManager")
     print()
     print(f"💾 Migrated Data:")
-    print(f"   - Paper Trades: {len(trades_df)} rows")
-    print(f"   - Analysis Log: {len(analysis_df)} rows")
+    print(f"   - Paper Trades: {trades_rows} rows")
+    print(f"   - Analysis Log: {analysis_rows} rows")
     print()
     print(f"📋 Sheets Created:")
     print(f"   - Paper_Trades (main data)")
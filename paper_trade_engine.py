@@ -11,19 +11,32 @@ __version__ = "2.0.0"  # Updated: Fixed create_trade to use trade_eligible flag
 
 import pandas as pd
 import numpy as np
-from dataclasses import dataclass, asdict
-from typing import Optional, List
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field, fields
+from typing import Optional, List, Dict
+from datetime import date, datetime, timedelta
 from enum import Enum
-import uuid
-import pytz
+from functools import lru_cache
+from itertools import compress
+import logging
+import multiprocessing
+import operator
+import secrets
+from zoneinfo import ZoneInfo
+
+from paper_trade_kernels import (
+    NUMBA_AVAILABLE,
+    EXIT_NONE, EXIT_STOP_LOSS, EXIT_TARGET_HIT, EXIT_BEHAVIOR_FAILURE, EXIT_MAX_HOLDING_DAYS,
+    step_exits, scan_exits,
+)
+
+logger = logging.getLogger(__name__)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # IST TIMEZONE HANDLING (CRITICAL FOR CLOUD DEPLOYMENT)
 # ═══════════════════════════════════════════════════════════════════════════
 
-IST = pytz.timezone("Asia/Kolkata")
+IST = ZoneInfo("Asia/Kolkata")  # stdlib tz singleton (no pytz localize overhead)
 
 def ist_now():
     """Get current datetime in IST (timezone-aware)"""
@@ -33,6 +46,41 @@ def ist_today():
     """Get current date in IST"""
     return ist_now().date()
 
+def to_date(value) -> date:
+    """Date part of a Timestamp/datetime/date (pd.to_datetime only for other inputs)"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return pd.to_datetime(value).date()
+
+def ist_datetimes(values) -> pd.DatetimeIndex:
+    """
+    Parse dates into one datetime64[Asia/Kolkata] column
+    
+    Aware values are converted to IST and naive ones are taken as IST, so
+    mixed naive/aware input or mixed offsets never degrade to object dtype.
+    """
+    try:
+        parsed = pd.DatetimeIndex(pd.to_datetime(values))
+    except (ValueError, TypeError):
+        # Mixed tz-awareness, offsets or formats: fix each value up first
+        parsed = pd.DatetimeIndex([
+            ts.tz_convert(IST) if ts.tzinfo is not None else ts.tz_localize(IST)
+            for ts in map(pd.Timestamp, values)
+        ])
+    
+    if parsed.tz is None:
+        return parsed.tz_localize(IST)
+    return parsed.tz_convert(IST)
+
+WEEKDAY_EPOCH = date(1900, 1, 1)  # precedes any trade date, so counts stay non-negative
+
+@lru_cache(maxsize=4096)
+def weekdays_before(day: date) -> int:
+    """Weekdays in [WEEKDAY_EPOCH, day); differences count trading days between dates"""
+    return int(np.busday_count(WEEKDAY_EPOCH, day))
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # TYPE DEFINITIONS
@@ -58,9 +106,9 @@ class ExitReason(Enum):
     PENDING = "PENDING"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class PaperTrade:
-    """Single paper trade record"""
+    """Single paper trade record (slotted: no per-instance __dict__)"""
     trade_id: str
     symbol: str
     entry_date: pd.Timestamp
@@ -101,6 +149,222 @@ class PaperTrade:
     
     # Notes
     notes: str = ""
+    
+    # Derived, not persisted: 100 / entry_price (price move → % of entry with one multiply)
+    _pct_per_rupee: float = field(init=False, repr=False, default=0.0)
+    # Derived, not persisted: date part of entry_date (filled on first update)
+    _entry_day: Optional[date] = field(init=False, repr=False, default=None)
+    
+    def __post_init__(self):
+        self._pct_per_rupee = 100.0 / self.entry_price if self.entry_price else 0.0
+
+
+# DataFrame schema for to_dataframe (column order follows the dataclass; derived fields excluded)
+TRADE_COLUMNS = tuple(f.name for f in fields(PaperTrade) if f.init)
+_trade_row = operator.attrgetter(*TRADE_COLUMNS)  # trade → tuple of column values
+
+TRADE_DTYPES = {
+    'entry_price': 'float64',
+    'shares': 'int64',
+    'position_value': 'float64',
+    'stop_loss': 'float64',
+    'target': 'float64',
+    'max_holding_days': 'int64',
+    'exit_price': 'float64',
+    'pnl': 'float64',
+    'pnl_pct': 'float64',
+    'holding_days': 'int64',
+    'mfe': 'float64',
+    'mae': 'float64',
+}
+
+TRADE_DATE_COLUMNS = ('entry_date', 'exit_date')
+
+TRADE_ENUM_COLUMNS = {
+    'status': TradeStatus,
+    'exit_reason': ExitReason,
+    'outcome': TradeOutcome,
+}
+
+# Enum columns are stored as categoricals over the member values (int8 codes)
+TRADE_ENUM_DTYPES = {
+    col: pd.CategoricalDtype([member.value for member in enum_class])
+    for col, enum_class in TRADE_ENUM_COLUMNS.items()
+}
+
+# Member (or its value string) → category code, for building the columns from codes
+TRADE_ENUM_CODES = {
+    col: {
+        key: code
+        for code, member in enumerate(enum_class)
+        for key in (member, member.value)
+    }
+    for col, enum_class in TRADE_ENUM_COLUMNS.items()
+}
+
+
+@lru_cache(maxsize=None)
+def enum_lookup(enum_class) -> dict:
+    """Every accepted spelling of each member: NAME, VALUE, 'Class.NAME', 'Class.VALUE'"""
+    lookup = {}
+    for member in enum_class:
+        for key in (member.name, member.value):
+            lookup[key] = member
+            lookup[f"{enum_class.__name__}.{key}"] = member
+    return lookup
+
+
+def parse_enum_column(enum_class, values: pd.Series, default) -> np.ndarray:
+    """
+    Parse a column of stored enums into enum members (vectorized)
+    
+    Handles multiple formats:
+    - 'VALUE' / 'NAME' → Direct lookup (e.g., 'NO-MOVE' or 'NO_MOVE')
+    - 'EnumClass.NAME' → Direct lookup (precomputed spelling)
+    - 'EnumClass(VALUE)' and other wrappers → Extracted with string ops
+    
+    Missing values map to default; unrecognized values map to default
+    with one warning per distinct value. Categorical columns are parsed
+    once per category and expanded through their codes.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = parse_enum_column(enum_class, pd.Series(values.cat.categories), default)
+        # Code -1 (missing) picks the trailing default
+        return np.append(categories, default)[values.cat.codes.to_numpy()]
+    
+    lookup = enum_lookup(enum_class)
+    
+    text = values.astype('string').str.strip()
+    parsed = text.map(lookup).to_numpy(dtype=object, copy=True)
+    unparsed = pd.isna(parsed)
+    
+    # Only leftovers pay for the string surgery
+    if unparsed.any():
+        rest = text[unparsed]
+        rest = rest.str.rsplit('.', n=1).str[-1]
+        rest = rest.str.extract(r'\(([^)]*)\)', expand=False).fillna(rest)
+        parsed[unparsed] = rest.map(lookup).to_numpy(dtype=object)
+        unparsed = pd.isna(parsed)
+    
+    invalid = unparsed & ~(values.isna() | (text == '')).to_numpy()
+    for value in pd.unique(values[invalid]):
+        logger.warning("⚠️ Invalid %s: '%s' → using %s", enum_class.__name__, value, default.value)
+    
+    parsed[unparsed] = default
+    return parsed
+
+
+def enum_categorical(col: str, values: pd.Series) -> pd.Categorical:
+    """Stored enum column (any accepted spelling) as its TRADE_ENUM_DTYPES categorical"""
+    if values.dtype == TRADE_ENUM_DTYPES[col]:
+        return values.array
+    
+    # Unrecognized values become missing (the engine defaults them on load)
+    members = parse_enum_column(TRADE_ENUM_COLUMNS[col], values, default=None)
+    code_of = TRADE_ENUM_CODES[col]
+    codes = np.fromiter((code_of.get(m, -1) for m in members), np.int8, len(members))
+    return pd.Categorical.from_codes(codes, dtype=TRADE_ENUM_DTYPES[col])
+
+
+def trades_to_dataframe(trades: List[PaperTrade]) -> pd.DataFrame:
+    """Columnar DataFrame of trades in the TRADE_COLUMNS schema"""
+    
+    if not trades:
+        return pd.DataFrame()
+    
+    # Read every field in one C-level call per trade, then transpose into
+    # one typed array per column (numeric columns land in their final
+    # dtype directly; None → NaN for the float columns)
+    columns = {}
+    for col, values in zip(TRADE_COLUMNS, zip(*map(_trade_row, trades))):
+        # Save enums as their value strings (e.g., 'OPEN' instead of 'TradeStatus.OPEN'),
+        # mapping members straight to category codes (unknown → missing)
+        if col in TRADE_ENUM_COLUMNS:
+            code_of = TRADE_ENUM_CODES[col]
+            codes = np.fromiter((code_of.get(e, -1) for e in values), np.int8, len(values))
+            columns[col] = pd.Categorical.from_codes(codes, dtype=TRADE_ENUM_DTYPES[col])
+        elif col in TRADE_DATE_COLUMNS:
+            # datetime64[Asia/Kolkata] directly (None → NaT), whatever mix of
+            # naive/aware values the trades carry
+            columns[col] = ist_datetimes(list(values))
+        elif col in TRADE_DTYPES:
+            # Known numeric dtype: fill the buffer directly, no type discovery pass
+            columns[col] = np.fromiter(values, TRADE_DTYPES[col], len(values))
+        else:
+            columns[col] = np.array(values, dtype=object)
+    
+    return pd.DataFrame(columns, copy=False)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# VECTORIZED TRADE BOOK
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TradeBook:
+    """
+    Struct-of-arrays view of open trades for vectorized per-bar updates
+    
+    Applies the same rules as PaperTradeEngine.update_trade to every trade
+    at once; the engine writes the results back to the PaperTrade records.
+    """
+    
+    def __init__(self, trades: List[PaperTrade]):
+        self.trades = list(trades)
+        n = len(self.trades)
+        
+        self.entry_price = np.fromiter((t.entry_price for t in self.trades), np.float64, n)
+        self.pct_per_rupee = np.fromiter((t._pct_per_rupee for t in self.trades), np.float64, n)
+        self.stop_loss = np.fromiter((t.stop_loss for t in self.trades), np.float64, n)
+        self.target = np.fromiter((t.target for t in self.trades), np.float64, n)
+        self.max_holding_days = np.fromiter((t.max_holding_days for t in self.trades), np.int64, n)
+        self.mfe = np.fromiter((t.mfe for t in self.trades), np.float64, n)
+        self.mae = np.fromiter((t.mae for t in self.trades), np.float64, n)
+        self.holding_days = np.fromiter((t.holding_days for t in self.trades), np.int64, n)
+        self.entry_day = np.array(
+            [to_date(t.entry_date) for t in self.trades], dtype='datetime64[D]'
+        )
+    
+    def step(
+        self,
+        current_day: np.datetime64,
+        close: np.ndarray,
+        low: np.ndarray,
+        high: np.ndarray,
+        is_failure: np.ndarray
+    ) -> np.ndarray:
+        """Advance all trades by one bar; returns an EXIT_* code per trade"""
+        
+        # Trading days held (same count as update_trade)
+        self.holding_days = np.busday_count(self.entry_day, current_day + 1) - 1
+        
+        # MFE/MAE before exit checks, from the day after entry onwards
+        after_entry = current_day > self.entry_day
+        
+        if NUMBA_AVAILABLE:
+            codes = np.empty(len(self.trades), dtype=np.int64)
+            step_exits(
+                self.entry_price, self.pct_per_rupee, self.stop_loss, self.target, self.max_holding_days,
+                self.mfe, self.mae, self.holding_days, after_entry,
+                low, high, is_failure, codes
+            )
+            return codes
+        
+        high_pnl_pct = (high - self.entry_price) * self.pct_per_rupee
+        low_pnl_pct = (low - self.entry_price) * self.pct_per_rupee
+        self.mfe = np.where(after_entry, np.maximum(self.mfe, high_pnl_pct), self.mfe)
+        self.mae = np.where(after_entry, np.minimum(self.mae, low_pnl_pct), self.mae)
+        
+        # Exit rules (priority order: first matching condition wins)
+        return np.select(
+            [
+                low <= self.stop_loss,
+                high >= self.target,
+                is_failure,
+                self.holding_days >= self.max_holding_days,
+            ],
+            [EXIT_STOP_LOSS, EXIT_TARGET_HIT, EXIT_BEHAVIOR_FAILURE, EXIT_MAX_HOLDING_DAYS],
+            default=EXIT_NONE
+        )
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -117,6 +381,10 @@ class TradeConfig:
     STOP_LOSS_PCT = 0.05  # 5% stop loss
     TARGET_PCT = 0.10     # 10% target (2:1 R:R)
     MAX_HOLDING_DAYS = 10  # Max 10 trading days
+    
+    # Price multipliers derived from the percentages above
+    STOP_MULT = 1 - STOP_LOSS_PCT
+    TARGET_MULT = 1 + TARGET_PCT
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -135,8 +403,12 @@ class PaperTradeEngine:
     
     def __init__(self, config: TradeConfig = None):
         self.config = config or TradeConfig()
-        self.open_trades: List[PaperTrade] = []
+        self.open_trades: Dict[str, PaperTrade] = {}  # trade_id → trade (insertion-ordered)
         self.closed_trades: List[PaperTrade] = []
+        self._id_prefix = secrets.token_hex(3)  # per-engine tag keeps ids unique across runs/workers
+        self._next_id = 0
+        self._closed_df: Optional[pd.DataFrame] = None  # to_dataframe cache (closed trades only)
+        self._closed_df_tag = None
     
     def create_trade(self, analysis_result) -> Optional[PaperTrade]:
         """
@@ -149,32 +421,35 @@ class PaperTradeEngine:
             PaperTrade if entry allowed, None otherwise
         """
         
-        # Debug logging
-        print(f"🔍 create_trade called for {analysis_result.symbol}")
-        print(f"   trade_eligible: {analysis_result.trade_eligible}")
+        # Debug logging (lazy %-formatting: nothing is formatted unless DEBUG is enabled)
+        logger.debug("🔍 create_trade called for %s (trade_eligible=%s)",
+                     analysis_result.symbol, analysis_result.trade_eligible)
         
         # Use the trade_eligible flag from analysis result
         if not analysis_result.trade_eligible:
-            print(f"❌ Trade creation rejected for {analysis_result.symbol}: trade_eligible=False")
-            print(f"   rejection_reasons: {analysis_result.rejection_reasons}")
+            logger.debug("❌ Trade creation rejected for %s: trade_eligible=False, rejection_reasons: %s",
+                         analysis_result.symbol, analysis_result.rejection_reasons)
             return None
         
-        print(f"✅ Entry rules passed for {analysis_result.symbol}, creating trade...")
+        logger.debug("✅ Entry rules passed for %s, creating trade...", analysis_result.symbol)
+        
+        cfg = self.config
         
         try:
             # Calculate position size
-            shares = int(self.config.DEFAULT_POSITION_VALUE / analysis_result.close)
-            position_value = shares * analysis_result.close
+            close = analysis_result.close
+            shares = int(cfg.DEFAULT_POSITION_VALUE / close)
+            position_value = shares * close
             
             # Calculate stop and target
-            stop_loss = analysis_result.close * (1 - self.config.STOP_LOSS_PCT)
-            target = analysis_result.close * (1 + self.config.TARGET_PCT)
+            stop_loss = close * cfg.STOP_MULT
+            target = close * cfg.TARGET_MULT
             
-            print(f"   Entry: ₹{analysis_result.close:.2f}, Stop: ₹{stop_loss:.2f}, Target: ₹{target:.2f}")
-            print(f"   Position: {shares} shares = ₹{position_value:.2f}")
+            logger.debug("   Entry: ₹%.2f, Stop: ₹%.2f, Target: ₹%.2f, Position: %d shares = ₹%.2f",
+                         close, stop_loss, target, shares, position_value)
             
             trade = PaperTrade(
-                trade_id=str(uuid.uuid4())[:8],
+                trade_id=self._new_trade_id(),
                 symbol=analysis_result.symbol,
                 entry_date=analysis_result.date,
                 entry_price=analysis_result.close,
@@ -182,7 +457,7 @@ class PaperTradeEngine:
                 position_value=position_value,
                 stop_loss=stop_loss,
                 target=target,
-                max_holding_days=self.config.MAX_HOLDING_DAYS,
+                max_holding_days=cfg.MAX_HOLDING_DAYS,
                 trend_state=analysis_result.trend_state.value,
                 entry_state=analysis_result.entry_state.value,
                 rs_state=analysis_result.rs_state.value,
@@ -192,14 +467,12 @@ class PaperTradeEngine:
                 status=TradeStatus.OPEN,
             )
             
-            self.open_trades.append(trade)
-            print(f"✅ Trade created successfully: {analysis_result.symbol} [{trade.trade_id}]")
+            self.open_trades[trade.trade_id] = trade
+            logger.debug("✅ Trade created successfully: %s [%s]", analysis_result.symbol, trade.trade_id)
             return trade
             
         except Exception as e:
-            print(f"❌ Exception creating trade for {analysis_result.symbol}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Exception creating trade for %s: %s", analysis_result.symbol, e)
             return None
     
     def update_trade(
@@ -229,14 +502,19 @@ class PaperTradeEngine:
         if trade.status == TradeStatus.CLOSED:
             return None
         
-        # Ensure dates are timezone-aware for correct calculation
-        # Convert to date-only for holding days calculation
-        entry_date_only = pd.to_datetime(trade.entry_date).date()
-        current_date_only = pd.to_datetime(current_date).date()
+        # Convert to date-only for holding days calculation (entry day cached on the trade)
+        entry_date_only = trade._entry_day
+        if entry_date_only is None:
+            entry_date_only = trade._entry_day = to_date(trade.entry_date)
+        current_date_only = to_date(current_date)
         
         # Update holding days (TRADING DAYS, not calendar days)
         # MAX_HOLDING_DAYS = 10 means 10 trading sessions, excluding weekends/holidays
-        trade.holding_days = len(pd.bdate_range(entry_date_only, current_date_only)) - 1
+        # Weekdays in [entry, current] minus the entry day (same count as len(pd.bdate_range(...)) - 1),
+        # as a difference of cached per-date weekday ordinals
+        trade.holding_days = (
+            weekdays_before(current_date_only + timedelta(days=1)) - weekdays_before(entry_date_only) - 1
+        )
         
         # ═══════════════════════════════════════════════════════════════════
         # Update MFE/MAE BEFORE Exit Checks (Critical Design Decision)
@@ -268,30 +546,43 @@ class PaperTradeEngine:
         # Only update MFE/MAE from day after entry onwards
         # Entry day high/low can include pre-entry price action (EOD entry)
         if current_date_only > entry_date_only:
-            high_pnl_pct = (high - trade.entry_price) / trade.entry_price
-            low_pnl_pct = (low - trade.entry_price) / trade.entry_price
+            # Cached reciprocal; locals avoid repeated attribute reads
+            entry_price = trade.entry_price
+            pct_per_rupee = trade._pct_per_rupee
+            high_pnl_pct = (high - entry_price) * pct_per_rupee
+            low_pnl_pct = (low - entry_price) * pct_per_rupee
             
-            trade.mfe = max(trade.mfe, high_pnl_pct * 100)
-            trade.mae = min(trade.mae, low_pnl_pct * 100)
+            if high_pnl_pct > trade.mfe:
+                trade.mfe = high_pnl_pct
+            if low_pnl_pct < trade.mae:
+                trade.mae = low_pnl_pct
         
         # EXIT RULES (Priority Order)
         
+        # Fast path: most bars hit no exit, so test all four rules in one
+        # short-circuit expression before the per-reason handling below
+        stop_loss = trade.stop_loss
+        target = trade.target
+        if (low > stop_loss and high < target and behavior != "FAILURE"
+                and trade.holding_days < trade.max_holding_days):
+            return None
+        
         # 1. Stop Loss (intraday low check)
-        if low <= trade.stop_loss:
+        if low <= stop_loss:
             return self._close_trade(
                 trade, 
                 current_date, 
-                trade.stop_loss,
+                stop_loss,
                 ExitReason.STOP_LOSS,
                 TradeOutcome.LOSS
             )
         
         # 2. Target Hit (intraday high check)
-        if high >= trade.target:
+        if high >= target:
             return self._close_trade(
                 trade,
                 current_date,
-                trade.target,
+                target,
                 ExitReason.TARGET_HIT,
                 TradeOutcome.WIN
             )
@@ -318,6 +609,117 @@ class PaperTradeEngine:
         
         return None
     
+    def update_trades(self, current_date: pd.Timestamp, bars: pd.DataFrame) -> List[PaperTrade]:
+        """
+        Update all open trades with one day's market data (vectorized)
+        
+        Args:
+            current_date: Current date
+            bars: DataFrame indexed by symbol with close, low, high, behavior
+        
+        Returns:
+            Trades closed on this bar (open trades without a bar are untouched)
+        """
+        
+        trades = [t for t in self.open_trades.values() if t.symbol in bars.index]
+        if not trades:
+            return []
+        
+        bar = bars.loc[[t.symbol for t in trades]]
+        return self.update_all(
+            current_date,
+            bar['close'].to_numpy(np.float64),
+            bar['low'].to_numpy(np.float64),
+            bar['high'].to_numpy(np.float64),
+            (bar['behavior'] == "FAILURE").to_numpy(bool),
+            trades=trades
+        )
+    
+    def update_all(
+        self,
+        current_date: pd.Timestamp,
+        close: np.ndarray,
+        low: np.ndarray,
+        high: np.ndarray,
+        is_failure: np.ndarray,
+        trades: Optional[List[PaperTrade]] = None
+    ) -> List[PaperTrade]:
+        """
+        Update open trades from bar arrays in one NumPy pass
+        
+        Args:
+            current_date: Current date
+            close, low, high, is_failure: One element per trade
+            trades: Trades the arrays are aligned with (default: open_trades in order)
+        
+        Returns:
+            Trades closed on this bar
+        """
+        
+        if trades is None:
+            trades = list(self.open_trades.values())
+        if not trades:
+            return []
+        
+        book = TradeBook(trades)
+        codes = book.step(np.datetime64(to_date(current_date), 'D'), close, low, high, is_failure)
+        
+        # Write back per-trade state
+        for i, trade in enumerate(trades):
+            trade.holding_days = int(book.holding_days[i])
+            trade.mfe = float(book.mfe[i])
+            trade.mae = float(book.mae[i])
+        
+        closed = []
+        for i in np.flatnonzero(codes):
+            trade = trades[i]
+            code = codes[i]
+            
+            if code == EXIT_STOP_LOSS:
+                exit_price, reason, outcome = trade.stop_loss, ExitReason.STOP_LOSS, TradeOutcome.LOSS
+            elif code == EXIT_TARGET_HIT:
+                exit_price, reason, outcome = trade.target, ExitReason.TARGET_HIT, TradeOutcome.WIN
+            elif code == EXIT_BEHAVIOR_FAILURE:
+                exit_price = float(close[i])
+                reason, outcome = ExitReason.BEHAVIOR_FAILURE, self._determine_outcome(trade, exit_price)
+            else:
+                exit_price, reason, outcome = float(close[i]), ExitReason.MAX_HOLDING_DAYS, TradeOutcome.NO_MOVE
+            
+            closed.append(self._close_trade(trade, current_date, exit_price, reason, outcome))
+        
+        return closed
+    
+    def _new_trade_id(self) -> str:
+        """Next trade id: engine tag + monotonic counter"""
+        self._next_id += 1
+        return f"{self._id_prefix}-{self._next_id:x}"
+    
+    def run_backtest(self, jobs, processes: Optional[int] = None):
+        """
+        Simulate independent symbols and merge the trades
+        
+        With Numba the whole batch goes through one parallel scan_exits call
+        (prange already spreads trades over all cores); otherwise symbols are
+        fanned out over worker processes.
+        
+        Args:
+            jobs: Iterable of (entries, bars) pairs, one per symbol (see run_symbols)
+            processes: Worker count for the process pool (default: os.cpu_count())
+        """
+        
+        if NUMBA_AVAILABLE:
+            results = [run_symbols(jobs, self.config)]
+        else:
+            with multiprocessing.Pool(processes) as pool:
+                results = pool.starmap(run_symbol, [(entries, bars, self.config) for entries, bars in jobs])
+        
+        for trades in results:
+            for trade in trades:
+                if trade.status is TradeStatus.OPEN:
+                    self.open_trades[trade.trade_id] = trade
+                else:
+                    self.closed_trades.append(trade)
+    
     def _close_trade(
         self,
         trade: PaperTrade,
@@ -336,17 +738,17 @@ class PaperTradeEngine:
         
         # Calculate P&L
         trade.pnl = (exit_price - trade.entry_price) * trade.shares
-        trade.pnl_pct = ((exit_price - trade.entry_price) / trade.entry_price) * 100
+        trade.pnl_pct = (exit_price - trade.entry_price) * trade._pct_per_rupee
         
         # Move to closed trades
-        self.open_trades.remove(trade)
+        del self.open_trades[trade.trade_id]
         self.closed_trades.append(trade)
         
         return trade
     
     def _determine_outcome(self, trade: PaperTrade, exit_price: float) -> TradeOutcome:
         """Determine outcome based on P&L"""
-        pnl_pct = ((exit_price - trade.entry_price) / trade.entry_price) * 100
+        pnl_pct = (exit_price - trade.entry_price) * trade._pct_per_rupee
         
         if pnl_pct > 1.0:
             return TradeOutcome.WIN
@@ -364,55 +766,75 @@ class PaperTradeEngine:
                 "open_trades": len(self.open_trades),
             }
         
-        outcomes = [t.outcome for t in self.closed_trades]
-        pnls = [t.pnl for t in self.closed_trades]
-        pnl_pcts = [t.pnl_pct for t in self.closed_trades]
-        
-        wins = [t for t in self.closed_trades if t.outcome == TradeOutcome.WIN]
-        losses = [t for t in self.closed_trades if t.outcome == TradeOutcome.LOSS]
-        no_moves = [t for t in self.closed_trades if t.outcome == TradeOutcome.NO_MOVE]
+        # Single pass over closed trades accumulating every aggregate
+        n = len(self.closed_trades)
+        wins = losses = no_moves = 0
+        win_pct_sum = loss_pct_sum = 0.0
+        total_pnl = total_pnl_pct = 0.0
+        max_pnl_pct = -np.inf
+        min_pnl_pct = np.inf
+        total_holding_days = 0
+        
+        for t in self.closed_trades:
+            pnl_pct = t.pnl_pct
+            outcome = t.outcome
+            
+            if outcome is TradeOutcome.WIN:
+                wins += 1
+                win_pct_sum += pnl_pct
+            elif outcome is TradeOutcome.LOSS:
+                losses += 1
+                loss_pct_sum += pnl_pct
+            elif outcome is TradeOutcome.NO_MOVE:
+                no_moves += 1
+            
+            total_pnl += t.pnl
+            total_pnl_pct += pnl_pct
+            if pnl_pct > max_pnl_pct:
+                max_pnl_pct = pnl_pct
+            if pnl_pct < min_pnl_pct:
+                min_pnl_pct = pnl_pct
+            total_holding_days += t.holding_days
         
         return {
-            "total_trades": len(self.closed_trades),
+            "total_trades": n,
             "open_trades": len(self.open_trades),
-            "wins": len(wins),
-            "losses": len(losses),
-            "no_moves": len(no_moves),
-            "win_rate": len(wins) / len(self.closed_trades) * 100 if self.closed_trades else 0,
-            "avg_win": np.mean([t.pnl_pct for t in wins]) if wins else 0,
-            "avg_loss": np.mean([t.pnl_pct for t in losses]) if losses else 0,
-            "total_pnl": sum(pnls),
-            "avg_pnl": np.mean(pnls),
-            "avg_pnl_pct": np.mean(pnl_pcts),
-            "max_win": max(pnl_pcts) if pnl_pcts else 0,
-            "max_loss": min(pnl_pcts) if pnl_pcts else 0,
-            "avg_holding_days": np.mean([t.holding_days for t in self.closed_trades]),
+            "wins": wins,
+            "losses": losses,
+            "no_moves": no_moves,
+            "win_rate": wins / n * 100,
+            "avg_win": win_pct_sum / wins if wins else 0,
+            "avg_loss": loss_pct_sum / losses if losses else 0,
+            "total_pnl": total_pnl,
+            "avg_pnl": total_pnl / n,
+            "avg_pnl_pct": total_pnl_pct / n,
+            "max_win": max_pnl_pct,
+            "max_loss": min_pnl_pct,
+            "avg_holding_days": total_holding_days / n,
         }
     
     def to_dataframe(self, include_open: bool = False) -> pd.DataFrame:
-        """Convert trades to DataFrame for storage/analysis"""
+        """
+        Convert trades to DataFrame for storage/analysis
+        
+        The closed-only frame is cached and sorted newest exit first.
+        """
         
-        trades = self.closed_trades.copy()
         if include_open:
-            trades.extend(self.open_trades)
+            return trades_to_dataframe(self.closed_trades + list(self.open_trades.values()))
+        
+        # Closed trades never change once closed, so the closed-only frame is
+        # rebuilt only when the list itself changes (reports call this repeatedly)
+        closed = self.closed_trades
+        tag = (id(closed), len(closed), closed[-1].trade_id if closed else None)
+        if tag != self._closed_df_tag:
+            # Sorted once here, before caching, so report pages never re-sort
+            self._closed_df = trades_to_dataframe(closed).sort_values(
+                'exit_date', ascending=False, kind='mergesort', ignore_index=True
+            )
+            self._closed_df_tag = tag
         
-        if not trades:
-            return pd.DataFrame()
-        
-        # Convert to dict and ensure enums are saved as their value strings
-        records = []
-        for trade in trades:
-            trade_dict = asdict(trade)
-            # Convert enum values to just their name (e.g., 'OPEN' instead of 'TradeStatus.OPEN')
-            if isinstance(trade.status, TradeStatus):
-                trade_dict['status'] = trade.status.value
-            if isinstance(trade.exit_reason, ExitReason):
-                trade_dict['exit_reason'] = trade.exit_reason.value
-            if isinstance(trade.outcome, TradeOutcome):
-                trade_dict['outcome'] = trade.outcome.value
-            records.append(trade_dict)
-        
-        return pd.DataFrame(records)
+        return self._closed_df.copy(deep=False)
     
     def load_from_dataframe(self, df: pd.DataFrame):
         """Load trades from DataFrame (for persistence)"""
@@ -420,86 +842,168 @@ class PaperTradeEngine:
         if df.empty:
             return
         
-        def parse_enum_value(enum_class, value, default=None):
-            """
-            Parse enum value with robust error handling and fallback
-            
-            Handles multiple formats:
-            - 'VALUE' → Direct enum lookup
-            - 'EnumClass.VALUE' → Strips class prefix
-            - 'EnumClass(VALUE)' → Extracts from parens
-            
-            Args:
-                enum_class: The enum class to parse into
-                value: The value to parse (can be string, enum, or None)
-                default: Default value if parsing fails (None = first enum value)
-            
-            Returns:
-                Parsed enum value or default/first enum value
-            """
-            if pd.isna(value) or value == '':
-                return default if default else list(enum_class)[0]
-            
-            value_str = str(value).strip()
-            
-            # Handle 'EnumClass.VALUE' format (strip prefix)
-            if '.' in value_str:
-                value_str = value_str.split('.')[-1]
-            
-            # Handle 'EnumClass(VALUE)' format
-            if '(' in value_str and ')' in value_str:
-                value_str = value_str.split('(')[1].split(')')[0]
-            
+        def is_missing(value) -> bool:
+            """Cheap scalar NaN/None check (NaN and NaT are not equal to themselves)"""
+            return value is None or value is pd.NA or value != value
+        
+        def to_timestamps(values: pd.Series) -> list:
+            """Convert a date column in one pass; per-value fallback for mixed formats/offsets"""
             try:
-                return enum_class[value_str]
-            except KeyError:
-                fallback = default if default else list(enum_class)[0]
-                print(f"⚠️ Invalid {enum_class.__name__}: '{value}' → using {fallback.value}")
-                return fallback
+                return pd.to_datetime(values).tolist()
+            except (ValueError, TypeError):
+                return [pd.NaT if is_missing(v) else pd.Timestamp(v) for v in values.tolist()]
         
         try:
-            for idx, row in df.iterrows():
-                # Parse enums with appropriate defaults
-                status = parse_enum_value(TradeStatus, row['status'], default=TradeStatus.OPEN)
-                exit_reason = parse_enum_value(ExitReason, row['exit_reason'], default=ExitReason.PENDING)
-                outcome = parse_enum_value(TradeOutcome, row['outcome'], default=TradeOutcome.PENDING)
-                
-                trade = PaperTrade(
-                    trade_id=row['trade_id'],
-                    symbol=row['symbol'],
-                    entry_date=pd.Timestamp(row['entry_date']),
-                    entry_price=float(row['entry_price']),
-                    shares=int(row['shares']),
-                    position_value=float(row['position_value']),
-                    stop_loss=float(row['stop_loss']),
-                    target=float(row['target']),
-                    max_holding_days=int(row['max_holding_days']),
-                    trend_state=str(row['trend_state']),
-                    entry_state=str(row['entry_state']),
-                    rs_state=str(row['rs_state']),
-                    behavior=str(row['behavior']),
-                    market_state=str(row['market_state']),
-                    fundamental_state=str(row['fundamental_state']),
-                    status=status,
-                    exit_date=pd.Timestamp(row['exit_date']) if pd.notna(row['exit_date']) else None,
-                    exit_price=float(row['exit_price']) if pd.notna(row['exit_price']) else None,
-                    exit_reason=exit_reason,
-                    outcome=outcome,
-                    pnl=float(row['pnl']),
-                    pnl_pct=float(row['pnl_pct']),
-                    holding_days=int(row['holding_days']),
-                    mfe=float(row['mfe']),
-                    mae=float(row['mae']),
-                    notes=str(row['notes']) if pd.notna(row['notes']) else "",
-                )
-                
-                if trade.status == TradeStatus.OPEN:
-                    self.open_trades.append(trade)
-                else:
-                    self.closed_trades.append(trade)
+            # Parse enums once per column with appropriate defaults
+            statuses = parse_enum_column(TradeStatus, df['status'], default=TradeStatus.OPEN)
+            exit_reasons = parse_enum_column(ExitReason, df['exit_reason'], default=ExitReason.PENDING)
+            outcomes = parse_enum_column(TradeOutcome, df['outcome'], default=TradeOutcome.PENDING)
+            
+            # Extract every column once (bulk numpy casts) in dataclass field order
+            columns = {
+                col: df[col].to_numpy(np.float64).tolist()
+                for col in ('entry_price', 'position_value', 'stop_loss', 'target',
+                            'pnl', 'pnl_pct', 'mfe', 'mae')
+            }
+            columns.update(
+                (col, df[col].to_numpy(np.int64).tolist())
+                for col in ('shares', 'max_holding_days', 'holding_days')
+            )
+            columns.update(
+                (col, [str(v) for v in df[col].tolist()])
+                for col in ('trend_state', 'entry_state', 'rs_state', 'behavior',
+                            'market_state', 'fundamental_state')
+            )
+            columns['trade_id'] = df['trade_id'].tolist()
+            columns['symbol'] = df['symbol'].tolist()
+            columns['notes'] = ["" if is_missing(v) else str(v) for v in df['notes'].tolist()]
+            columns['entry_date'] = to_timestamps(df['entry_date'])
+            columns['exit_date'] = [None if is_missing(v) else v for v in to_timestamps(df['exit_date'])]
+            columns['exit_price'] = [None if v != v else v for v in df['exit_price'].to_numpy(np.float64).tolist()]
+            columns['status'] = statuses
+            columns['exit_reason'] = exit_reasons
+            columns['outcome'] = outcomes
+            
+            trades = [PaperTrade(*row) for row in zip(*(columns[col] for col in TRADE_COLUMNS))]
+            
+            # Partition once on the parsed status
+            is_open = statuses == TradeStatus.OPEN
+            self.open_trades.update((t.trade_id, t) for t in compress(trades, is_open))
+            self.closed_trades.extend(compress(trades, ~is_open))
         
         except Exception as e:
-            print(f"❌ Error loading trades from dataframe: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Error loading trades from dataframe: %s", e)
             raise
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PER-SYMBOL SIMULATION (multiprocessing worker)
+# ═══════════════════════════════════════════════════════════════════════════
+
+def run_symbols(jobs, config: TradeConfig = None) -> List[PaperTrade]:
+    """
+    Forward-simulate independent symbols in one kernel call
+    
+    Args:
+        jobs: Iterable of (entries, bars) pairs, one per symbol
+            entries: AnalysisResults for the symbol (create_trade is tried on each)
+            bars: Daily bars indexed by date (ascending) with close, low, high, behavior
+        config: TradeConfig for the simulation
+    
+    Returns:
+        Closed trades (symbol by symbol, in exit order) followed by trades
+        still open after their symbol's last bar
+    
+    Entries are taken at EOD on their bar date and walked forward from the
+    next bar by scan_exits, which applies the update_trade rules per bar.
+    Bars of all symbols are concatenated and each trade scans only its own
+    symbol's slice, so with Numba the scan runs across all cores.
+    """
+    engine = PaperTradeEngine(config)
+    
+    trades = []
+    first_bar, end_bar = [], []
+    bar_frames, bar_dates = [], []
+    offset = 0
+    
+    for entries, bars in jobs:
+        bar_days = np.array([to_date(d) for d in bars.index], dtype='datetime64[D]')
+        bar_day_set = set(bar_days.tolist())
+        
+        for result in entries:
+            day = to_date(result.date)
+            if day not in bar_day_set:
+                continue
+            trade = engine.create_trade(result)
+            if trade is not None:
+                trades.append(trade)
+                first_bar.append(offset + int(np.searchsorted(bar_days, np.datetime64(day, 'D'), side='right')))
+                end_bar.append(offset + len(bar_days))
+        
+        bar_frames.append(bars[['close', 'low', 'high', 'behavior']])
+        bar_dates.extend(bars.index)
+        offset += len(bar_days)
+    
+    if not trades:
+        return []
+    
+    bars = pd.concat(bar_frames, ignore_index=True)
+    close = bars['close'].to_numpy(np.float64)
+    bar_days = np.array([to_date(d) for d in bar_dates], dtype='datetime64[D]')
+    
+    n = len(trades)
+    entry_days = np.array([to_date(t.entry_date) for t in trades], dtype='datetime64[D]')
+    
+    exit_bar = np.empty(n, dtype=np.int64)
+    codes = np.empty(n, dtype=np.int64)
+    holding_days = np.empty(n, dtype=np.int64)
+    mfe = np.empty(n, dtype=np.float64)
+    mae = np.empty(n, dtype=np.float64)
+    
+    # Trading days held = weekdays in [entry, bar] - 1, via counts from a common epoch
+    epoch = np.datetime64(WEEKDAY_EPOCH, 'D')
+    
+    scan_exits(
+        np.fromiter((t.entry_price for t in trades), np.float64, n),
+        np.fromiter((t.stop_loss for t in trades), np.float64, n),
+        np.fromiter((t.target for t in trades), np.float64, n),
+        np.fromiter((t.max_holding_days for t in trades), np.int64, n),
+        np.busday_count(epoch, entry_days),
+        np.array(first_bar, dtype=np.int64),
+        np.array(end_bar, dtype=np.int64),
+        bars['low'].to_numpy(np.float64),
+        bars['high'].to_numpy(np.float64),
+        (bars['behavior'] == "FAILURE").to_numpy(bool),
+        np.busday_count(epoch, bar_days + 1),
+        exit_bar, codes, holding_days, mfe, mae
+    )
+    
+    for i, trade in enumerate(trades):
+        trade.holding_days = int(holding_days[i])
+        trade.mfe = float(mfe[i])
+        trade.mae = float(mae[i])
+    
+    # Materialize exits bar by bar so closed_trades keeps exit order
+    for i in sorted(np.flatnonzero(codes).tolist(), key=lambda k: exit_bar[k]):
+        trade = trades[i]
+        code = codes[i]
+        j = exit_bar[i]
+        
+        if code == EXIT_STOP_LOSS:
+            exit_price, reason, outcome = trade.stop_loss, ExitReason.STOP_LOSS, TradeOutcome.LOSS
+        elif code == EXIT_TARGET_HIT:
+            exit_price, reason, outcome = trade.target, ExitReason.TARGET_HIT, TradeOutcome.WIN
+        elif code == EXIT_BEHAVIOR_FAILURE:
+            exit_price = float(close[j])
+            reason, outcome = ExitReason.BEHAVIOR_FAILURE, engine._determine_outcome(trade, exit_price)
+        else:
+            exit_price, reason, outcome = float(close[j]), ExitReason.MAX_HOLDING_DAYS, TradeOutcome.NO_MOVE
+        
+        engine._close_trade(trade, bar_dates[j], exit_price, reason, outcome)
+    
+    return engine.closed_trades + list(engine.open_trades.values())
+
+
+def run_symbol(entries, bars: pd.DataFrame, config: TradeConfig = None) -> List[PaperTrade]:
+    """Forward-simulate one symbol in isolation (module-level so it pickles; see run_symbols)"""
+    return run_symbols([(entries, bars)], config)
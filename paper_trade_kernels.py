@@ -0,0 +1,116 @@
+"""
+Paper Trade Kernels
+Array kernels behind the vectorized paper-trade paths
+
+Each kernel applies exactly the rules of PaperTradeEngine.update_trade
+(MFE/MAE first, then Stop → Target → Behavior → Max Days) to plain NumPy
+arrays. They compile with Numba when it is installed and run as ordinary
+Python loops otherwise.
+
+Optional: pip install numba
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+# Exit codes (in exit priority order)
+EXIT_NONE = 0
+EXIT_STOP_LOSS = 1
+EXIT_TARGET_HIT = 2
+EXIT_BEHAVIOR_FAILURE = 3
+EXIT_MAX_HOLDING_DAYS = 4
+
+
+def step_exits(entry_price, pct_per_rupee, stop_loss, target, max_holding_days, mfe, mae,
+               holding_days, after_entry, low, high, is_failure, codes):
+    """
+    Advance every open trade by one bar (one trade per element)
+    
+    Updates mfe/mae in place and writes an EXIT_* code per trade to codes.
+    """
+    for i in prange(entry_price.shape[0]):
+        if after_entry[i]:
+            high_pnl_pct = (high[i] - entry_price[i]) * pct_per_rupee[i]
+            low_pnl_pct = (low[i] - entry_price[i]) * pct_per_rupee[i]
+            if high_pnl_pct > mfe[i]:
+                mfe[i] = high_pnl_pct
+            if low_pnl_pct < mae[i]:
+                mae[i] = low_pnl_pct
+        
+        if low[i] <= stop_loss[i]:
+            codes[i] = EXIT_STOP_LOSS
+        elif high[i] >= target[i]:
+            codes[i] = EXIT_TARGET_HIT
+        elif is_failure[i]:
+            codes[i] = EXIT_BEHAVIOR_FAILURE
+        elif holding_days[i] >= max_holding_days[i]:
+            codes[i] = EXIT_MAX_HOLDING_DAYS
+        else:
+            codes[i] = EXIT_NONE
+
+
+def scan_exits(entry_price, stop_loss, target, max_holding_days, entry_busday, first_bar, end_bar,
+               bar_low, bar_high, bar_is_failure, bar_busday_end,
+               exit_bar, codes, holding_days, mfe, mae):
+    """
+    Walk each trade forward through its symbol's bars until it exits
+    
+    Bars of several symbols can be concatenated; each trade only scans its
+    own [first_bar, end_bar) slice, so trades (and therefore symbols) are
+    independent and the outer loop runs in parallel under Numba.
+    
+    Args:
+        entry_busday: Weekdays before each entry date (np.busday_count from a fixed epoch)
+        first_bar: Index of the first bar after each entry date
+        end_bar: One past the last bar of each trade's symbol
+        bar_busday_end: Weekdays up to and including each bar date (same epoch)
+    
+    Outputs (per trade): exit_bar (-1 while still open), codes (EXIT_*),
+    holding_days, mfe, mae as of the exit bar or the last bar.
+    """
+    for i in prange(entry_price.shape[0]):
+        pct_per_rupee = 100.0 / entry_price[i]
+        trade_mfe = 0.0
+        trade_mae = 0.0
+        held = 0
+        exit_at = -1
+        code = EXIT_NONE
+        
+        for j in range(first_bar[i], end_bar[i]):
+            held = bar_busday_end[j] - entry_busday[i] - 1
+            
+            high_pnl_pct = (bar_high[j] - entry_price[i]) * pct_per_rupee
+            low_pnl_pct = (bar_low[j] - entry_price[i]) * pct_per_rupee
+            if high_pnl_pct > trade_mfe:
+                trade_mfe = high_pnl_pct
+            if low_pnl_pct < trade_mae:
+                trade_mae = low_pnl_pct
+            
+            if bar_low[j] <= stop_loss[i]:
+                code = EXIT_STOP_LOSS
+            elif bar_high[j] >= target[i]:
+                code = EXIT_TARGET_HIT
+            elif bar_is_failure[j]:
+                code = EXIT_BEHAVIOR_FAILURE
+            elif held >= max_holding_days[i]:
+                code = EXIT_MAX_HOLDING_DAYS
+            
+            if code != EXIT_NONE:
+                exit_at = j
+                break
+        
+        exit_bar[i] = exit_at
+        codes[i] = code
+        holding_days[i] = held
+        mfe[i] = trade_mfe
+        mae[i] = trade_mae
+
+
+if NUMBA_AVAILABLE:
+    step_exits = njit(parallel=True, cache=True)(step_exits)
+    scan_exits = njit(parallel=True, cache=True)(scan_exits)
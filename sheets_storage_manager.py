@@ -7,13 +7,47 @@ Philosophy: Let Sheets handle data, Python handles logic
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from datetime import datetime
-import pytz
+from collections import Counter
+from itertools import compress
+from operator import attrgetter
+from zoneinfo import ZoneInfo
 import os
 from dotenv import load_dotenv
 import time
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+import asyncio
+import gzip
+import json
+import hashlib
+import importlib.util
+
+from storage_manager import fund_checks_to_boolean
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+    HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None  # httpx[http2]
+except ImportError:
+    HTTPX_AVAILABLE = HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 load_dotenv()
 
@@ -21,31 +55,94 @@ load_dotenv()
 # IST TIMEZONE
 # ═══════════════════════════════════════════════════════════════════════════
 
-IST = pytz.timezone("Asia/Kolkata")
+IST = ZoneInfo("Asia/Kolkata")
 
 def ist_now():
     """Get current datetime in IST"""
     return datetime.now(IST)
 
 
+# Column types of rows read back from Sheets (blank cells come back as "")
+TRADE_DATE_COLUMNS = ['entry_date', 'exit_date', 'created_at', 'updated_at']
+TRADE_NUMERIC_COLUMNS = [
+    'entry_price', 'shares', 'position_value', 'stop_loss', 'target', 'exit_price',
+    'pnl', 'pnl_pct', 'holding_days', 'mfe', 'mae',
+]
+LOG_DATE_COLUMNS = ['date', 'timestamp']
+LOG_NUMERIC_COLUMNS = ['fundamental_score', 'rs_value', 'close', 'rsi', 'consecutive_bars']
+
+
+def json_dumps(data) -> bytes:
+    """Encode a request body (orjson when installed: bytes out, numpy scalars handled)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data).encode()
+
+
+def json_loads(content: bytes):
+    """Decode a response body straight from bytes; errors are json.JSONDecodeError"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def frame_to_records(df: pd.DataFrame, timestamp_cols=()) -> List[Dict]:
+    """JSON-ready row dicts, converted column-wise: missing → "", timestamps → ISO strings"""
+    out = df.astype(object)
+    out = out.where(out.notna(), "")
+    
+    for col in timestamp_cols:
+        if col in out.columns:
+            out[col] = [v.isoformat() if isinstance(v, datetime) else v for v in out[col].tolist()]
+    
+    return out.to_dict(orient="records")
+
+
+def frame_digest(df: pd.DataFrame) -> str:
+    """Content hash of a DataFrame (column names + values, index ignored)"""
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16)
+    digest.update('\x1f'.join(map(str, df.columns)).encode())
+    return digest.hexdigest()
+
+
+def coerce_columns(df: pd.DataFrame, date_columns=(), numeric_columns=()) -> pd.DataFrame:
+    """Parse date and numeric columns as two block assignments (absent columns skipped)"""
+    dates = df.columns.intersection(date_columns)
+    if len(dates):
+        df[dates] = df[dates].apply(pd.to_datetime, errors='coerce')
+    
+    numbers = df.columns.intersection(numeric_columns)
+    if len(numbers):
+        df[numbers] = df[numbers].apply(pd.to_numeric, errors='coerce')
+    return df
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════════
 
-def get_config(key: str, default=None):
-    """Get config from .env or Streamlit secrets"""
-    value = os.getenv(key)
-    if value:
-        return value
+def _load_config() -> Dict:
+    """Streamlit secrets overlaid with non-empty environment variables (.env loaded above)"""
+    config = {}
     
     try:
         import streamlit as st
-        if hasattr(st, 'secrets') and key in st.secrets:
-            return st.secrets[key]
-    except:
-        pass
+        config.update(st.secrets.to_dict())
+    except Exception:
+        pass  # No Streamlit or no secrets.toml: environment only
     
-    return default
+    config.update((key, value) for key, value in os.environ.items() if value)
+    return config
+
+
+# Resolved once at import; get_config is a plain dict lookup
+_CONFIG = _load_config()
+
+
+def get_config(key: str, default=None):
+    """Get config from .env or Streamlit secrets"""
+    return _CONFIG.get(key, default)
 
 
 class SheetsConfig:
@@ -60,6 +157,26 @@ class SheetsConfig:
     # Timeout for API calls
     TIMEOUT = 30
     
+    # Connection pooling and retries (urllib3 Retry on the session adapter)
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 16
+    MAX_RETRIES = 3
+    BACKOFF_FACTOR = 1  # exponential backoff between attempts
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    
+    # Gzip POST bodies larger than GZIP_MIN_BYTES. Opt-in: Apps Script hides request
+    # headers from doPost, so the deployed script must check e.postData.type for
+    # application/gzip and decode with Utilities.ungzip before enabling this.
+    GZIP_REQUESTS = str(get_config('APPS_SCRIPT_GZIP', '')).lower() in ('1', 'true', 'yes')
+    GZIP_MIN_BYTES = 1024
+    
+    # Per-trade write fallback: steady requests/second with bursts (token bucket)
+    WRITE_RATE = 2.0  # the old fixed 500ms spacing
+    WRITE_BURST = 5
+    
+    # Read cache: repeated GETs within this many seconds are served from memory
+    CACHE_TTL = 10
+    
     @classmethod
     def validate(cls):
         """Validate configuration"""
@@ -81,6 +198,36 @@ class SheetsConfig:
 # GOOGLE SHEETS CLIENT
 # ═══════════════════════════════════════════════════════════════════════════
 
+class TokenBucket:
+    """Rate limiter: `rate` requests/second on average, bursts of up to `capacity`"""
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def consume(self):
+        """Take one token; sleep only as long as it takes to accrue when empty"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Going negative reserves the next slot for this caller
+            self.tokens -= 1
+            wait = -self.tokens / self.rate
+        
+        if wait > 0:
+            time.sleep(wait)
+    
+    def drain(self):
+        """Empty the bucket (quota hit) so following calls wait for a refill"""
+        with self._lock:
+            self.tokens = 0.0
+            self.updated = time.monotonic()
+
+
 class SheetsClient:
     """Client for Google Sheets via Apps Script API"""
     
@@ -89,63 +236,145 @@ class SheetsClient:
         self.url = SheetsConfig.APPS_SCRIPT_URL
         self.api_key = SheetsConfig.API_KEY
         self.timeout = SheetsConfig.TIMEOUT
+        self.session = self._build_session()
+        self._cache: Dict[Tuple, Tuple[float, Dict]] = {}
+        self.bucket = TokenBucket(SheetsConfig.WRITE_RATE, SheetsConfig.WRITE_BURST)
         self.available = True
         self.error = None
     
-    def _request(self, method: str, params: Dict = None, data: Dict = None, max_retries: int = 3) -> Dict:
-        """Make API request to Apps Script with retry logic"""
-        last_error = None
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """Keep-alive session: pooled TCP/TLS connections reused across calls"""
+        retry = Retry(
+            total=SheetsConfig.MAX_RETRIES,
+            backoff_factor=SheetsConfig.BACKOFF_FACTOR,
+            status_forcelist=SheetsConfig.RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=SheetsConfig.POOL_CONNECTIONS,
+            pool_maxsize=SheetsConfig.POOL_MAXSIZE,
+            max_retries=retry,
+        )
         
-        for attempt in range(max_retries):
-            try:
-                if method == "GET":
-                    params = params or {}
-                    params['api_key'] = self.api_key
-                    
-                    response = requests.get(
-                        self.url,
-                        params=params,
-                        timeout=self.timeout
-                    )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"})
+        return session
+    
+    def _request(self, method: str, params: Dict = None, data: Dict = None) -> Dict:
+        """Make API request to Apps Script (retries/backoff handled by the session adapter)"""
+        try:
+            if method == "GET":
+                params = params or {}
+                params['api_key'] = self.api_key
                 
-                elif method == "POST":
-                    data = data or {}
-                    data['api_key'] = self.api_key
-                    
-                    response = requests.post(
-                        self.url,
-                        json=data,
-                        timeout=self.timeout
-                    )
+                response = self.session.get(
+                    self.url,
+                    params=params,
+                    timeout=self.timeout
+                )
+            
+            elif method == "POST":
+                data = data or {}
+                data['api_key'] = self.api_key
                 
-                else:
-                    raise ValueError(f"Unsupported method: {method}")
+                body = json_dumps(data)
+                headers = {"Content-Type": "application/json"}
+                if SheetsConfig.GZIP_REQUESTS and len(body) > SheetsConfig.GZIP_MIN_BYTES:
+                    body = gzip.compress(body)
+                    headers = {"Content-Type": "application/gzip", "Content-Encoding": "gzip"}
                 
-                response.raise_for_status()
-                return response.json()
+                response = self.session.post(
+                    self.url,
+                    data=body,
+                    headers=headers,
+                    timeout=self.timeout
+                )
             
-            except requests.exceptions.Timeout as e:
-                last_error = e
-                if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
-                    print(f"⏳ Request timeout, retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
-                    continue
+            else:
+                raise ValueError(f"Unsupported method: {method}")
             
-            except requests.exceptions.RequestException as e:
-                last_error = e
-                # For DNS errors or connection errors, don't retry immediately
-                if attempt < max_retries - 1 and "nodename nor servname" not in str(e):
-                    wait_time = 2 ** attempt
-                    print(f"⏳ Request failed, retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
-                    continue
-                break  # Don't retry DNS errors
-        
-        error_msg = f"API request failed after {max_retries} attempts: {last_error}"
-        print(f"❌ {error_msg}")
-        self.error = error_msg
-        return {"success": False, "error": str(last_error)}
+            response.raise_for_status()
+            return json_loads(response.content)
+        
+        except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+            if getattr(getattr(e, 'response', None), 'status_code', None) == 429:
+                self.bucket.drain()
+            
+            error_msg = f"API request failed (up to {SheetsConfig.MAX_RETRIES} retries): {e}"
+            print(f"❌ {error_msg}")
+            self.error = error_msg
+            return {"success": False, "error": str(e)}
+    
+    # Reads whose cached results a write makes stale
+    TRADE_READS = ("get_all_trades", "get_trade_counts", "get_statistics")
+    LOG_READS = ("get_analysis_log", "get_statistics")
+    
+    @staticmethod
+    def _cache_key(params: Dict) -> Tuple:
+        """Cache key: action first (for invalidation), then the remaining params"""
+        return (params["action"], *sorted((k, v) for k, v in params.items() if k != "action"))
+    
+    def _cache_lookup(self, key: Tuple, ttl: float) -> Optional[Dict]:
+        """Cached response for key if younger than ttl seconds"""
+        hit = self._cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+        return None
+    
+    def _cache_store(self, key: Tuple, result: Dict):
+        """Remember successful responses only, so failures are retried next call"""
+        if result.get('success'):
+            self._cache[key] = (time.monotonic(), result)
+    
+    def _cached_get(self, params: Dict, ttl: float = SheetsConfig.CACHE_TTL) -> Dict:
+        """GET through the TTL cache"""
+        key = self._cache_key(params)
+        result = self._cache_lookup(key, ttl)
+        if result is None:
+            result = self._request("GET", params=dict(params))
+            self._cache_store(key, result)
+        return result
+    
+    def invalidate(self, actions=None):
+        """Drop cached reads for the given actions (all when None)"""
+        if actions is None:
+            self._cache.clear()
+            return
+        # Snapshot the keys: background log uploads may invalidate concurrently
+        for key in [key for key in list(self._cache) if key[0] in actions]:
+            self._cache.pop(key, None)
+    
+    def get_many(self, *param_sets: Dict) -> List[Dict]:
+        """
+        Issue independent GET requests concurrently
+        
+        Cached responses are served from memory. The rest go through
+        AsyncSheetsClient (httpx or aiohttp) when installed; otherwise they
+        run on worker threads sharing the pooled session.
+        """
+        keys = [self._cache_key(params) for params in param_sets]
+        results = [self._cache_lookup(key, SheetsConfig.CACHE_TTL) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        
+        if missing:
+            if HTTPX_AVAILABLE or AIOHTTP_AVAILABLE:
+                async_client = AsyncSheetsClient(self.url, self.api_key, self.timeout)
+                fetched = asyncio.run(async_client.get_many([param_sets[i] for i in missing]))
+            elif len(missing) == 1:
+                fetched = [self._request("GET", params=dict(param_sets[missing[0]]))]
+            else:
+                with ThreadPoolExecutor(max_workers=min(len(missing), SheetsConfig.POOL_MAXSIZE)) as pool:
+                    fetched = list(pool.map(lambda i: self._request("GET", params=dict(param_sets[i])), missing))
+            
+            for i, result in zip(missing, fetched):
+                self._cache_store(keys[i], result)
+                results[i] = result
+        
+        return results
     
     # ═══════════════════════════════════════════════════════════════════════
     # TRADE OPERATIONS
@@ -153,30 +382,56 @@ class SheetsClient:
     
     def get_all_trades(self) -> Dict:
         """Get all trades from Sheets"""
-        return self._request("GET", params={"action": "get_all_trades"})
+        return self._cached_get({"action": "get_all_trades"})
     
     def get_open_trades(self) -> Dict:
-        """Get open trades"""
-        return self._request("GET", params={"action": "get_open_trades"})
+        """Get open trades (filtered from the cached get_all_trades payload)"""
+        return self._trades_with_status('OPEN')
     
     def get_closed_trades(self) -> Dict:
-        """Get closed trades"""
-        return self._request("GET", params={"action": "get_closed_trades"})
+        """Get closed trades (filtered from the cached get_all_trades payload)"""
+        return self._trades_with_status('CLOSED')
+    
+    def _trades_with_status(self, status: str) -> Dict:
+        """Filter get_all_trades client-side instead of a separate API call"""
+        result = self.get_all_trades()
+        if not result.get('success'):
+            return result
+        
+        trades = [trade for trade in result.get('trades', []) if trade.get('status') == status]
+        return {"success": True, "trades": trades}
+    
+    def get_trade_counts(self) -> Dict:
+        """Get trade counts only: {"success": true, "counts": {"total", "open", "closed"}}"""
+        return self._cached_get({"action": "get_trade_counts"})
     
     def create_trade(self, trade: Dict) -> Dict:
         """Create new trade"""
-        return self._request("POST", data={
+        result = self._request("POST", data={
             "action": "create_trade",
             "trade": trade
         })
+        self.invalidate(self.TRADE_READS)
+        return result
     
     def update_trade(self, trade_id: str, updates: Dict) -> Dict:
         """Update existing trade"""
-        return self._request("POST", data={
+        result = self._request("POST", data={
             "action": "update_trade",
             "trade_id": trade_id,
             "updates": updates
         })
+        self.invalidate(self.TRADE_READS)
+        return result
+    
+    def batch_upsert_trades(self, trades: List[Dict]) -> Dict:
+        """Create or update many trades in one call (matched by trade_id)"""
+        result = self._request("POST", data={
+            "action": "batch_upsert_trades",
+            "trades": trades
+        })
+        self.invalidate(self.TRADE_READS)
+        return result
     
     # ═══════════════════════════════════════════════════════════════════════
     # ANALYSIS LOG OPERATIONS
@@ -184,21 +439,25 @@ class SheetsClient:
     
     def log_analysis(self, analysis: Dict) -> Dict:
         """Log single analysis result"""
-        return self._request("POST", data={
+        result = self._request("POST", data={
             "action": "log_analysis",
             "analysis": analysis
         })
+        self.invalidate(self.LOG_READS)
+        return result
     
     def batch_log_analysis(self, analyses: List[Dict]) -> Dict:
         """Log multiple analysis results"""
-        return self._request("POST", data={
+        result = self._request("POST", data={
             "action": "batch_log_analysis",
             "analyses": analyses
         })
+        self.invalidate(self.LOG_READS)
+        return result
     
     def get_analysis_log(self, days: int = 30) -> Dict:
         """Get analysis log for recent days"""
-        return self._request("GET", params={
+        return self._cached_get({
             "action": "get_analysis_log",
             "days": days
         })
@@ -209,7 +468,86 @@ class SheetsClient:
     
     def get_statistics(self) -> Dict:
         """Get pre-calculated statistics from Dashboard sheet"""
-        return self._request("GET", params={"action": "get_statistics"})
+        return self._cached_get({"action": "get_statistics"})
+
+
+class AsyncSheetsClient:
+    """
+    Async GETs against the Apps Script API (httpx or aiohttp)
+    
+    Independent reads complete in max(RTT) instead of sum(RTT). httpx is
+    preferred: with h2 installed the concurrent GETs share one TLS connection
+    as HTTP/2 streams. A client lives for one get_many call, since asyncio.run
+    gives each call its own event loop and async clients are bound to the loop
+    that created them.
+    """
+    
+    # Transport failures worth a retry, from whichever backends are installed
+    RETRY_ERRORS = (
+        (asyncio.TimeoutError, json.JSONDecodeError)
+        + ((aiohttp.ClientError,) if AIOHTTP_AVAILABLE else ())
+        + ((httpx.HTTPError,) if HTTPX_AVAILABLE else ())
+    )
+    
+    def __init__(self, url: str, api_key: str, timeout: int):
+        self.url = url
+        self.api_key = api_key
+        self.timeout = timeout
+    
+    async def get_many(self, param_sets) -> List[Dict]:
+        """Run every GET concurrently; results in request order"""
+        if HTTPX_AVAILABLE:
+            limits = httpx.Limits(max_keepalive_connections=8, max_connections=16)
+            async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, timeout=self.timeout, limits=limits,
+                                         follow_redirects=True) as client:
+                return await asyncio.gather(*(self._get(self._fetch_httpx, client, params)
+                                              for params in param_sets))
+        
+        connector = aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            return await asyncio.gather(*(self._get(self._fetch_aiohttp, session, params)
+                                          for params in param_sets))
+    
+    async def _fetch_httpx(self, client, params: Dict):
+        """(status, body bytes) via httpx; Apps Script answers through a redirect"""
+        response = await client.get(self.url, params=params)
+        return response.status_code, response.content
+    
+    async def _fetch_aiohttp(self, session, params: Dict):
+        """(status, body bytes) via aiohttp"""
+        async with session.get(self.url, params=params) as response:
+            return response.status, await response.read()
+    
+    async def _get(self, fetch, client, params: Dict) -> Dict:
+        """GET with the same retry policy as the sync session adapter"""
+        params = {**params, 'api_key': self.api_key}
+        
+        for attempt in range(SheetsConfig.MAX_RETRIES + 1):
+            try:
+                status, content = await fetch(client, params)
+                if status < 400:
+                    # Apps Script may label JSON as text/html; parse regardless
+                    return json_loads(content)
+                error = f"HTTP {status}"
+                retry = status in SheetsConfig.RETRY_STATUSES
+            
+            except self.RETRY_ERRORS as e:
+                error = str(e) or type(e).__name__
+                retry = True
+            
+            if not retry or attempt == SheetsConfig.MAX_RETRIES:
+                print(f"❌ API request failed (up to {SheetsConfig.MAX_RETRIES} retries): {error}")
+                return {"success": False, "error": error}
+            
+            await asyncio.sleep(SheetsConfig.BACKOFF_FACTOR * 2 ** attempt)
+
+
+# Analysis-log uploads for every manager share one worker so appends land in
+# submission order; queued uploads are flushed at interpreter exit
+LOG_UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sheets-log")
+atexit.register(LOG_UPLOAD_EXECUTOR.shutdown)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -242,6 +580,13 @@ class SheetsStorageManager:
             self.error = str(e)
             print(f"❌ Sheets initialization failed: {e}")
         
+        # Digest of the last trades frame saved in full; identical re-saves are skipped
+        self._last_saved_hash = None
+        
+        # Queued analysis-log uploads and the error of the last failed one
+        self._log_futures = []
+        self.log_error = None
+        
         # Compatibility attributes for old StorageManager interface
         self.use_drive = True  # We're using cloud storage (Sheets)
         self.drive_available = self.available  # Sheets available = "drive" available
@@ -257,8 +602,9 @@ class SheetsStorageManager:
         Save/update trades to Google Sheets
         
         Strategy:
-        - For new trades: Create via API
-        - For existing trades: Update via API
+        - One batch_upsert_trades call (Apps Script matches rows by trade_id)
+        - Fallback for deployments without the batch action:
+          create/update per trade via API
         """
         if not self.available:
             print("⚠️ Sheets not available, cannot save trades")
@@ -268,60 +614,72 @@ class SheetsStorageManager:
             return True
         
         try:
-            # Get existing trade IDs from Sheets
-            result = self.client.get_all_trades()
-            
-            if not result.get('success'):
-                print(f"❌ Failed to fetch existing trades: {result.get('error')}")
-                return False
+            # Streamlit reruns often re-save an unchanged book: skip the round-trip
+            frame_hash = frame_digest(trades_df)
+            if frame_hash == self._last_saved_hash:
+                return True
             
-            existing_trades = result.get('trades', [])
-            existing_ids = {t['trade_id'] for t in existing_trades}
+            trades = frame_to_records(trades_df, ('entry_date', 'exit_date'))
             
-            # Separate new vs updated trades
-            success_count = 0
-            failed_trades = []
+            result = self.client.batch_upsert_trades(trades)
             
-            for idx, (_, row) in enumerate(trades_df.iterrows()):
-                trade_dict = row.to_dict()
-                trade_id = trade_dict['trade_id']
-                
-                # Convert timestamps to ISO strings
-                for col in ['entry_date', 'exit_date']:
-                    if col in trade_dict and pd.notna(trade_dict[col]):
-                        if isinstance(trade_dict[col], pd.Timestamp):
-                            trade_dict[col] = trade_dict[col].isoformat()
-                
-                # Replace NaN with empty string
-                trade_dict = {k: (v if pd.notna(v) else "") for k, v in trade_dict.items()}
-                
-                if trade_id in existing_ids:
-                    # Update existing
-                    result = self.client.update_trade(trade_id, trade_dict)
-                else:
-                    # Create new
-                    result = self.client.create_trade(trade_dict)
-                
-                if result.get('success'):
-                    success_count += 1
-                else:
-                    failed_trades.append(trade_id)
-                
-                # Rate limiting: small delay between requests
-                if idx < len(trades_df) - 1:  # Don't sleep after last request
-                    time.sleep(0.5)  # 500ms between requests
-            
-            if failed_trades:
-                print(f"⚠️ Saved {success_count}/{len(trades_df)} trades (failed: {', '.join(failed_trades)})")
-            else:
-                print(f"✅ Saved {success_count}/{len(trades_df)} trades to Sheets")
+            if result.get('success'):
+                self._last_saved_hash = frame_hash
+                print(f"✅ Saved {len(trades)} trades to Sheets")
+                return True
             
-            return success_count > 0  # Partial success is still success
+            # Upserts are keyed by trade_id, so replaying them one by one is safe
+            print(f"⚠️ Batch upsert failed ({result.get('error')}), saving trades individually")
+            return self._save_trades_individually(trades)
         
         except Exception as e:
             print(f"❌ Error saving trades: {e}")
             return False
     
+    def _save_trades_individually(self, trades: List[Dict]) -> bool:
+        """Per-trade create/update (one API call per trade, token-bucket rate limited)"""
+        # Get existing trade IDs from Sheets
+        result = self.client.get_all_trades()
+        
+        if not result.get('success'):
+            print(f"❌ Failed to fetch existing trades: {result.get('error')}")
+            return False
+        
+        # Partition into updates/creates up front (one vectorized membership test)
+        existing_ids = pd.Index([t['trade_id'] for t in result.get('trades', [])])
+        is_update = pd.Index([t['trade_id'] for t in trades]).isin(existing_ids)
+        
+        writes = [(trade, True) for trade in compress(trades, is_update)]
+        writes += [(trade, False) for trade in compress(trades, ~is_update)]
+        
+        success_count = 0
+        failed_trades = []
+        
+        for trade_dict, exists in writes:
+            trade_id = trade_dict['trade_id']
+            
+            # Rate limiting: bursts pass straight through, sustained runs are paced
+            self.client.bucket.consume()
+            
+            if exists:
+                # Update existing
+                result = self.client.update_trade(trade_id, trade_dict)
+            else:
+                # Create new
+                result = self.client.create_trade(trade_dict)
+            
+            if result.get('success'):
+                success_count += 1
+            else:
+                failed_trades.append(trade_id)
+        
+        if failed_trades:
+            print(f"⚠️ Saved {success_count}/{len(trades)} trades (failed: {', '.join(failed_trades)})")
+        else:
+            print(f"✅ Saved {success_count}/{len(trades)} trades to Sheets")
+        
+        return success_count > 0  # Partial success is still success
+    
     def load_trades(self) -> pd.DataFrame:
         """Load all trades from Google Sheets"""
         if not self.available:
@@ -329,82 +687,94 @@ class SheetsStorageManager:
             return pd.DataFrame()
         
         try:
-            result = self.client.get_all_trades()
-            
-            if not result.get('success'):
-                print(f"❌ Failed to load trades: {result.get('error')}")
-                return pd.DataFrame()
-            
-            trades = result.get('trades', [])
-            
-            if not trades:
-                return pd.DataFrame()
-            
-            df = pd.DataFrame(trades)
-            
-            # Convert date columns
-            for col in ['entry_date', 'exit_date', 'created_at', 'updated_at']:
-                if col in df.columns:
-                    df[col] = pd.to_datetime(df[col], errors='coerce')
-            
-            # Convert numeric columns
-            numeric_cols = ['entry_price', 'shares', 'position_value', 'stop_loss', 
-                          'target', 'exit_price', 'pnl', 'pnl_pct', 'holding_days', 
-                          'mfe', 'mae']
-            
-            for col in numeric_cols:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-            
-            print(f"📥 Loaded {len(df)} trades from Sheets")
-            return df
+            return self._trades_frame(self.client.get_all_trades())
         
         except Exception as e:
             print(f"❌ Error loading trades: {e}")
             return pd.DataFrame()
     
+    def _trades_frame(self, result: Dict) -> pd.DataFrame:
+        """Typed trades DataFrame from a get_all_trades response"""
+        if not result.get('success'):
+            print(f"❌ Failed to load trades: {result.get('error')}")
+            return pd.DataFrame()
+        
+        trades = result.get('trades', [])
+        
+        if not trades:
+            return pd.DataFrame()
+        
+        df = coerce_columns(pd.DataFrame(trades), TRADE_DATE_COLUMNS, TRADE_NUMERIC_COLUMNS)
+        
+        print(f"📥 Loaded {len(df)} trades from Sheets")
+        return df
+    
     # ═══════════════════════════════════════════════════════════════════════
     # ANALYSIS LOG
     # ═══════════════════════════════════════════════════════════════════════
     
     def save_analysis_log(self, log_df: pd.DataFrame) -> bool:
-        """Save analysis log to Google Sheets"""
+        """
+        Save analysis log to Google Sheets
+        
+        Rows are converted here; the upload is queued on LOG_UPLOAD_EXECUTOR.
+        Returns False if this or an earlier queued upload failed (see log_error).
+        """
         if not self.available:
             print("⚠️ Sheets not available")
             return False
         
+        # Report uploads that finished since the last call
+        previous_ok = self._collect_log_uploads()
+        
         if log_df.empty:
-            return True
+            return previous_ok
         
         try:
             # Convert to list of dicts
-            analyses = []
-            
-            for _, row in log_df.iterrows():
-                analysis = row.to_dict()
-                
-                # Convert timestamps
-                if 'date' in analysis and pd.notna(analysis['date']):
-                    if isinstance(analysis['date'], pd.Timestamp):
-                        analysis['date'] = analysis['date'].isoformat()
-                
-                # Replace NaN
-                analysis = {k: (v if pd.notna(v) else "") for k, v in analysis.items()}
-                analyses.append(analysis)
-            
-            # Batch log
+            analyses = frame_to_records(log_df, ('date',))
+        
+        except Exception as e:
+            print(f"❌ Error saving analysis log: {e}")
+            self.log_error = str(e)
+            return False
+        
+        self._log_futures.append(LOG_UPLOAD_EXECUTOR.submit(self._upload_analysis_log, analyses))
+        return previous_ok
+    
+    def _upload_analysis_log(self, analyses: List[Dict]) -> Optional[str]:
+        """Batch log (runs on the executor); the error message, or None on success"""
+        try:
             result = self.client.batch_log_analysis(analyses)
             
             if result.get('success'):
                 print(f"✅ Logged {len(analyses)} analyses to Sheets")
-                return True
+                return None
             else:
                 print(f"❌ Failed to log analyses: {result.get('error')}")
-                return False
+                return str(result.get('error'))
         
         except Exception as e:
             print(f"❌ Error saving analysis log: {e}")
+            return str(e)
+    
+    def _collect_log_uploads(self, timeout: Optional[float] = None, block: bool = False) -> bool:
+        """Consume finished uploads (waiting for all if block); False if any failed"""
+        if block and self._log_futures:
+            wait(self._log_futures, timeout)
+        
+        done = [f for f in self._log_futures if f.done()]
+        self._log_futures = [f for f in self._log_futures if not f.done()]
+        
+        errors = [error for error in (f.result() for f in done) if error]
+        if errors:
+            self.log_error = "; ".join(errors)
             return False
+        return True
+    
+    def flush_analysis_log(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued analysis-log uploads; False if any failed (see log_error)"""
+        return self._collect_log_uploads(timeout, block=True)
     
     def load_analysis_log(self, days: int = 30) -> pd.DataFrame:
         """Load analysis log from Google Sheets"""
@@ -412,6 +782,9 @@ class SheetsStorageManager:
             print("⚠️ Sheets not available")
             return pd.DataFrame()
         
+        # Queued uploads must land before the read (failures surface via flush)
+        self.flush_analysis_log()
+        
         try:
             result = self.client.get_analysis_log(days)
             
@@ -424,14 +797,8 @@ class SheetsStorageManager:
             if not analyses:
                 return pd.DataFrame()
             
-            df = pd.DataFrame(analyses)
-            
-            # Convert timestamps
-            if 'date' in df.columns:
-                df['date'] = pd.to_datetime(df['date'], errors='coerce')
-            
-            if 'timestamp' in df.columns:
-                df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
+            df = coerce_columns(pd.DataFrame(analyses), LOG_DATE_COLUMNS, LOG_NUMERIC_COLUMNS)
+            fund_checks_to_boolean(df)
             
             print(f"📥 Loaded {len(df)} analysis entries from Sheets")
             return df
@@ -446,29 +813,46 @@ class SheetsStorageManager:
     
     def get_storage_info(self) -> dict:
         """Get storage status"""
-        trades_df = self.load_trades()
+        counts = {"total": 0, "open": 0, "closed": 0}
+        stats_result = {}
+        
+        # Counts and dashboard statistics are independent reads: fetch them together
+        if self.available:
+            try:
+                counts_result, stats_result = self.client.get_many(
+                    {"action": "get_trade_counts"},
+                    {"action": "get_statistics"},
+                )
+                if counts_result.get('success'):
+                    counts = {**counts, **counts_result.get('counts', {})}
+                else:
+                    # Deployment without get_trade_counts: count the full trade list
+                    counts = self._count_trades(self.client.get_all_trades())
+            except Exception as e:
+                print(f"⚠️ Could not fetch storage info: {e}")
         
         info = {
             "storage_mode": "Google Sheets",
             "sheets_connected": self.available,
             "sheets_url": SheetsConfig.APPS_SCRIPT_URL if self.available else "N/A",
-            "total_trades": len(trades_df),
-            "open_trades": len(trades_df[trades_df['status'] == 'OPEN']) if not trades_df.empty else 0,
-            "closed_trades": len(trades_df[trades_df['status'] == 'CLOSED']) if not trades_df.empty else 0,
+            "total_trades": counts["total"],
+            "open_trades": counts["open"],
+            "closed_trades": counts["closed"],
             "last_updated": ist_now().isoformat(),
         }
         
-        # Get statistics from Sheets
-        if self.available:
-            try:
-                stats_result = self.client.get_statistics()
-                if stats_result.get('success'):
-                    info['dashboard_stats'] = stats_result.get('statistics', {})
-            except Exception as e:
-                print(f"⚠️ Could not fetch dashboard stats: {e}")
+        if stats_result.get('success'):
+            info['dashboard_stats'] = stats_result.get('statistics', {})
         
         return info
     
+    @staticmethod
+    def _count_trades(result: Dict) -> Dict:
+        """Trade counts from a get_all_trades response (no DataFrame needed)"""
+        trades = result.get('trades', []) if result.get('success') else []
+        status = Counter(trade.get('status') for trade in trades)
+        return {"total": len(trades), "open": status['OPEN'], "closed": status['CLOSED']}
+    
     def export_trades_for_analysis(self, output_path: Optional[str] = None) -> pd.DataFrame:
         """Export trades for external analysis"""
         df = self.load_trades()
@@ -477,9 +861,10 @@ class SheetsStorageManager:
             return df
         
         # Add derived columns
-        df['entry_year'] = pd.to_datetime(df['entry_date']).dt.year
-        df['entry_month'] = pd.to_datetime(df['entry_date']).dt.month
-        df['entry_weekday'] = pd.to_datetime(df['entry_date']).dt.day_name()
+        entry_date = pd.to_datetime(df['entry_date'], errors='coerce')
+        df['entry_year'] = entry_date.dt.year
+        df['entry_month'] = entry_date.dt.month
+        df['entry_weekday'] = entry_date.dt.day_name()
         
         if output_path:
             df.to_csv(output_path, index=False)
@@ -492,46 +877,58 @@ class SheetsStorageManager:
 # HELPER FUNCTIONS (for compatibility with existing code)
 # ═══════════════════════════════════════════════════════════════════════════
 
+# AnalysisResult fields read by analysis_result_to_log_entry, in one C-level call
+_LOG_ENTRY_FIELDS = attrgetter(
+    'date', 'symbol', 'market_state', 'fundamental_state', 'fundamental_score',
+    'fundamental_reasons', 'trend_state', 'entry_state', 'rs_state', 'rs_value',
+    'behavior', 'trade_eligible', 'rejection_reasons', 'close', 'rsi',
+    'consecutive_bars_above_emas',
+)
+
+
 def analysis_result_to_log_entry(analysis_result) -> dict:
     """Convert AnalysisResult to log entry dictionary"""
+    (day, symbol, market_state, fundamental_state, fundamental_score, fund_reasons,
+     trend_state, entry_state, rs_state, rs_value, behavior, trade_eligible,
+     rejection_reasons, close, rsi, consecutive_bars) = _LOG_ENTRY_FIELDS(analysis_result)
     
-    def format_bool_check(value):
-        """Convert boolean to string for storage"""
-        if value is None:
-            return 'None'
-        return str(value)
+    fund_reasons = fund_reasons or {}
     
-    fund_reasons = analysis_result.fundamental_reasons or {}
+    try:
+        day = day.isoformat()
+    except AttributeError:
+        day = str(day)
     
+    # Boolean checks are stored as strings: str(None) gives the 'None' (no data) marker
     return {
-        'date': analysis_result.date.isoformat() if hasattr(analysis_result.date, 'isoformat') else str(analysis_result.date),
-        'symbol': analysis_result.symbol,
-        'market_state': analysis_result.market_state.value,
+        'date': day,
+        'symbol': symbol,
+        'market_state': market_state.value,
         
         # Fundamental details
-        'fundamental_state': analysis_result.fundamental_state.value,
-        'fundamental_score': analysis_result.fundamental_score,
+        'fundamental_state': fundamental_state.value,
+        'fundamental_score': fundamental_score,
         
         # Individual fundamental checks
-        'fund_eps_growth': format_bool_check(fund_reasons.get('eps_growth')),
-        'fund_pe_reasonable': format_bool_check(fund_reasons.get('pe_reasonable')),
-        'fund_debt_acceptable': format_bool_check(fund_reasons.get('debt_acceptable')),
-        'fund_roe_strong': format_bool_check(fund_reasons.get('roe_strong')),
-        'fund_cashflow_positive': format_bool_check(fund_reasons.get('cashflow_positive')),
+        'fund_eps_growth': str(fund_reasons.get('eps_growth')),
+        'fund_pe_reasonable': str(fund_reasons.get('pe_reasonable')),
+        'fund_debt_acceptable': str(fund_reasons.get('debt_acceptable')),
+        'fund_roe_strong': str(fund_reasons.get('roe_strong')),
+        'fund_cashflow_positive': str(fund_reasons.get('cashflow_positive')),
         
         # Technical states
-        'trend_state': analysis_result.trend_state.value,
-        'entry_state': analysis_result.entry_state.value,
-        'rs_state': analysis_result.rs_state.value,
-        'rs_value': analysis_result.rs_value,
-        'behavior': analysis_result.behavior.value,
+        'trend_state': trend_state.value,
+        'entry_state': entry_state.value,
+        'rs_state': rs_state.value,
+        'rs_value': rs_value,
+        'behavior': behavior.value,
         
         # Decision
-        'trade_eligible': analysis_result.trade_eligible,
-        'rejection_reasons': '|'.join(analysis_result.rejection_reasons) if analysis_result.rejection_reasons else '',
+        'trade_eligible': trade_eligible,
+        'rejection_reasons': '|'.join(rejection_reasons) if rejection_reasons else '',
         
         # Price data
-        'close': analysis_result.close,
-        'rsi': analysis_result.rsi,
-        'consecutive_bars': analysis_result.consecutive_bars_above_emas,
+        'close': close,
+        'rsi': rsi,
+        'consecutive_bars': consecutive_bars,
     }
\ No newline at end of file
@@ -9,13 +9,16 @@ Philosophy: Persistent, accessible, auditable
 import pandas as pd
 import os
 import json
-from typing import Optional, Dict
+import hashlib
+from typing import Optional, Dict, Tuple
 from pathlib import Path
 from datetime import datetime
 import io
-import pytz
+from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 
+from paper_trade_engine import TRADE_DATE_COLUMNS, TRADE_ENUM_COLUMNS, enum_categorical, ist_datetimes
+
 # Load environment variables from .env file (for local development)
 load_dotenv()
 
@@ -42,7 +45,7 @@ def get_config(key: str, default=None):
 # IST TIMEZONE HANDLING (CRITICAL FOR CLOUD DEPLOYMENT)
 # ═══════════════════════════════════════════════════════════════════════════
 
-IST = pytz.timezone("Asia/Kolkata")
+IST = ZoneInfo("Asia/Kolkata")
 
 def ist_now():
     """Get current datetime in IST (timezone-aware)"""
@@ -53,6 +56,61 @@ def ist_today():
     return ist_now().date()
 
 
+# Fundamental check columns are stored as strings ('True'/'False'/'None');
+# convert them once on load to nullable booleans (True/False/<NA>)
+FUND_CHECK_COLUMNS = [
+    'fund_eps_growth',
+    'fund_pe_reasonable',
+    'fund_debt_acceptable',
+    'fund_roe_strong',
+    'fund_cashflow_positive',
+]
+
+FUND_CHECK_VALUES = {
+    'True': True, 'TRUE': True, 'true': True, True: True,
+    'False': False, 'FALSE': False, 'false': False, False: False,
+}
+
+
+def fund_checks_to_boolean(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert fundamental check columns to pandas nullable boolean dtype"""
+    for col in FUND_CHECK_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].map(FUND_CHECK_VALUES).astype('boolean')
+    return df
+
+
+def file_md5(path: Path) -> str:
+    """Hex MD5 of a file (compared against Drive's md5Checksum)"""
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'md5').hexdigest()
+
+
+def write_frame(df: pd.DataFrame, path: Path):
+    """Write a store file (Parquet)"""
+    df.to_parquet(path, engine='pyarrow', compression='snappy', index=False)
+
+
+def coerce_store_dtypes(df: pd.DataFrame, date_columns=()) -> pd.DataFrame:
+    """Store dtypes: date columns in IST, trade enum columns as their categoricals"""
+    for col in date_columns:
+        if col in df.columns:
+            df[col] = ist_datetimes(df[col])
+    for col in TRADE_ENUM_COLUMNS:
+        if col in df.columns:
+            df[col] = enum_categorical(col, df[col])
+    return df
+
+
+def read_frame(path: Path, date_columns=()) -> pd.DataFrame:
+    """Read a store file (Parquet, or a legacy CSV) in the store dtypes"""
+    if path.suffix == '.parquet':
+        df = pd.read_parquet(path, engine='pyarrow')
+    else:
+        df = pd.read_csv(path)
+    return coerce_store_dtypes(df, date_columns)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # GOOGLE DRIVE INTEGRATION
 # ═══════════════════════════════════════════════════════════════════════════
@@ -87,11 +145,16 @@ class StorageConfig:
     # Google Drive folder name (will be created if doesn't exist)
     DRIVE_FOLDER_NAME = get_config('DRIVE_FOLDER_NAME', 'TradingSystem_Data')
     
-    # File names
-    PAPER_TRADES_FILE = "paper_trades.csv"
-    ANALYSIS_LOG_FILE = "analysis_log.csv"
+    # File names (Parquet: typed, compressed)
+    PAPER_TRADES_FILE = "paper_trades.parquet"
+    ANALYSIS_LOG_FILE = "analysis_log.parquet"
     METADATA_FILE = "metadata.json"
     
+    # Pre-Parquet stores, migrated once on first load, then renamed with this suffix
+    LEGACY_TRADES_FILE = "paper_trades.csv"
+    LEGACY_ANALYSIS_LOG_FILE = "analysis_log.csv"
+    MIGRATED_SUFFIX = ".migrated.csv"
+    
     @classmethod
     def ensure_local_dirs(cls):
         """Create local storage directories"""
@@ -303,7 +366,7 @@ class DriveClient:
             
             media = MediaIoBaseUpload(
                 io.BytesIO(content),
-                mimetype='text/csv',
+                mimetype='text/csv' if local_path.suffix == '.csv' else 'application/octet-stream',
                 resumable=True
             )
             
@@ -337,6 +400,9 @@ class DriveClient:
         """
         Download file from Drive
         
+        Skipped when local_path already matches the Drive md5Checksum, so an
+        unchanged file keeps its mtime (and StorageManager's parsed-frame cache).
+        
         Args:
             file_name: Remote file name
             folder_id: Parent folder ID
@@ -351,7 +417,7 @@ class DriveClient:
             results = self.service.files().list(
                 q=query,
                 spaces='drive',
-                fields='files(id, name)'
+                fields='files(id, name, md5Checksum)'
             ).execute()
             
             files = results.get('files', [])
@@ -361,6 +427,9 @@ class DriveClient:
             
             file_id = files[0]['id']
             
+            if local_path.exists() and files[0].get('md5Checksum') == file_md5(local_path):
+                return True
+            
             request = self.service.files().get_media(fileId=file_id)
             
             with open(local_path, 'wb') as f:
@@ -375,6 +444,43 @@ class DriveClient:
             print(f"Failed to download file: {e}")
             return False
     
+    def rename_file(self, file_name: str, folder_id: str, new_name: str) -> bool:
+        """
+        Rename a file in Drive
+        
+        Args:
+            file_name: Current remote file name
+            folder_id: Parent folder ID
+            new_name: New remote file name
+        
+        Returns:
+            True if a file was renamed
+        """
+        query = f"name='{file_name}' and '{folder_id}' in parents and trashed=false"
+        
+        try:
+            results = self.service.files().list(
+                q=query,
+                spaces='drive',
+                fields='files(id, name)'
+            ).execute()
+            
+            files = results.get('files', [])
+            
+            if not files:
+                return False
+            
+            self.service.files().update(
+                fileId=files[0]['id'],
+                body={'name': new_name}
+            ).execute()
+            
+            return True
+            
+        except HttpError as e:
+            print(f"Failed to rename file: {e}")
+            return False
+    
     def list_files(self, folder_id: str) -> list:
         """List files in folder"""
         query = f"'{folder_id}' in parents and trashed=false"
@@ -443,6 +549,9 @@ class StorageManager:
         self.trades_path = self.config.LOCAL_CACHE_DIR / self.config.PAPER_TRADES_FILE
         self.analysis_path = self.config.LOCAL_CACHE_DIR / self.config.ANALYSIS_LOG_FILE
         self.metadata_path = self.config.LOCAL_CACHE_DIR / self.config.METADATA_FILE
+        
+        # Parsed store files keyed by path, valid while (mtime_ns, size) is unchanged
+        self._frame_cache: Dict[Path, Tuple[Tuple[int, int], pd.DataFrame]] = {}
     
     # ═══════════════════════════════════════════════════════════════════════
     # PAPER TRADES STORAGE
@@ -465,21 +574,24 @@ class StorageManager:
             # Load existing trades (from cache or Drive)
             existing_df = self.load_trades()
             
+            # Stored history is already sorted: sort only the new batch, then a stable
+            # mergesort (timsort) merges the two sorted runs in ~linear time
+            # Same dtypes as the stored history, so the concat keeps them
+            trades_df = coerce_store_dtypes(trades_df.copy(deep=False), TRADE_DATE_COLUMNS)
+            trades_df = trades_df.sort_values('entry_date', kind='mergesort')
+            
             if existing_df.empty:
                 combined_df = trades_df
             else:
-                # Upsert strategy
-                existing_ids = set(existing_df['trade_id'].values)
-                new_ids = set(trades_df['trade_id'].values)
-                
-                kept_df = existing_df[~existing_df['trade_id'].isin(new_ids)]
+                # Upsert strategy: one hash-based isin, no Python sets
+                kept_df = existing_df[~existing_df['trade_id'].isin(trades_df['trade_id'].to_numpy())]
                 combined_df = pd.concat([kept_df, trades_df], ignore_index=True)
             
             # Sort by entry date
-            combined_df = combined_df.sort_values('entry_date')
+            combined_df = combined_df.sort_values('entry_date', kind='mergesort')
             
             # Save to local cache first
-            combined_df.to_csv(self.trades_path, index=False)
+            self._write_cached(combined_df, self.trades_path)
             
             # Upload to Drive
             if self.use_drive:
@@ -496,6 +608,7 @@ class StorageManager:
             return True
             
         except Exception as e:
+            self._frame_cache.clear()
             print(f"❌ Error saving trades: {e}")
             return False
     
@@ -518,16 +631,11 @@ class StorageManager:
                     print("📥 Loaded trades from Drive")
             
             # Load from local cache
-            if not self.trades_path.exists():
+            if not self.trades_path.exists() and not self._migrate_legacy_csv(
+                    self.trades_path, self.config.LEGACY_TRADES_FILE, TRADE_DATE_COLUMNS):
                 return pd.DataFrame()
             
-            df = pd.read_csv(self.trades_path)
-            
-            if not df.empty:
-                df['entry_date'] = pd.to_datetime(df['entry_date'])
-                df['exit_date'] = pd.to_datetime(df['exit_date'])
-            
-            return df
+            return self._read_cached(self.trades_path, TRADE_DATE_COLUMNS)
             
         except Exception as e:
             print(f"⚠️  Error loading trades: {e}")
@@ -554,6 +662,13 @@ class StorageManager:
             # Load existing log
             existing_df = self.load_analysis_log()
             
+            # Typed like the stored log (entries carry ISO date strings and
+            # 'True'/'False'/'None' checks) so the columns concatenate cleanly
+            log_df = fund_checks_to_boolean(coerce_store_dtypes(log_df.copy(deep=False), ('date',)))
+            
+            # Stored log is already sorted: sort only the new entries (merged below)
+            log_df = log_df.sort_values('date', kind='mergesort')
+            
             if existing_df.empty:
                 combined_df = log_df
             else:
@@ -564,11 +679,11 @@ class StorageManager:
                     keep='last'
                 )
             
-            # Sort by date
-            combined_df = combined_df.sort_values('date')
+            # Sort by date (stable mergesort over two sorted runs)
+            combined_df = combined_df.sort_values('date', kind='mergesort')
             
             # Save to local cache
-            combined_df.to_csv(self.analysis_path, index=False)
+            self._write_cached(combined_df, self.analysis_path)
             
             # Upload to Drive
             if self.use_drive:
@@ -585,6 +700,7 @@ class StorageManager:
             return True
             
         except Exception as e:
+            self._frame_cache.clear()
             print(f"❌ Error saving analysis log: {e}")
             return False
     
@@ -607,13 +723,14 @@ class StorageManager:
                     print("📥 Loaded analysis log from Drive")
             
             # Load from local cache
-            if not self.analysis_path.exists():
+            if not self.analysis_path.exists() and not self._migrate_legacy_csv(
+                    self.analysis_path, self.config.LEGACY_ANALYSIS_LOG_FILE, ('date',)):
                 return pd.DataFrame()
             
-            df = pd.read_csv(self.analysis_path)
+            df = self._read_cached(self.analysis_path, ('date',))
             
             if not df.empty:
-                df['date'] = pd.to_datetime(df['date'])
+                fund_checks_to_boolean(df)
             
             return df
             
@@ -621,6 +738,69 @@ class StorageManager:
             print(f"⚠️  Error loading analysis log: {e}")
             return pd.DataFrame()
     
+    def _read_cached(self, path: Path, date_columns) -> pd.DataFrame:
+        """read_frame, reusing the parsed frame until the file changes on disk"""
+        stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        
+        hit = self._frame_cache.get(path)
+        if hit is None or hit[0] != key:
+            hit = (key, read_frame(path, date_columns))
+            self._frame_cache[path] = hit
+        
+        # Copy-on-write: callers may modify their copy without touching the cache
+        return hit[1].copy(deep=False)
+    
+    def _write_cached(self, df: pd.DataFrame, path: Path):
+        """write_frame, then cache the frame just written (no re-parse on next load)"""
+        write_frame(df, path)
+        stat = path.stat()
+        self._frame_cache[path] = ((stat.st_mtime_ns, stat.st_size), df.reset_index(drop=True))
+    
+    def _migrate_legacy_csv(self, path: Path, legacy_name: str, date_columns) -> bool:
+        """
+        One-time move of a pre-Parquet CSV store (Drive or local cache) to path
+        
+        The Parquet file is uploaded right away and the CSV (local and Drive)
+        is renamed to *.migrated.csv so it can't be read as a stale store.
+        Returns True if path now exists.
+        """
+        legacy_path = path.with_name(legacy_name)
+        retired_name = Path(legacy_name).stem + self.config.MIGRATED_SUFFIX
+        
+        # Drive copy is authoritative; falls back to a local-only CSV
+        on_drive = self.use_drive and self.drive_client.download_file(
+            legacy_name, self.folder_id, legacy_path
+        )
+        
+        if not legacy_path.exists():
+            return False
+        
+        df = read_frame(legacy_path, date_columns)
+        if legacy_name == self.config.LEGACY_ANALYSIS_LOG_FILE:
+            fund_checks_to_boolean(df)
+        
+        write_frame(df, path)
+        
+        # Round-trip check (values and dtypes) before the CSV is retired
+        if not read_frame(path, date_columns).equals(df):
+            path.unlink()
+            print(f"❌ Migration of {legacy_name} failed its round-trip check; CSV kept")
+            return False
+        
+        if self.use_drive:
+            try:
+                self.drive_client.upload_file(path, path.name, self.folder_id)
+                if on_drive:
+                    self.drive_client.rename_file(legacy_name, self.folder_id, retired_name)
+            except Exception as e:
+                # Drive keeps the CSV; the Parquet copy reaches Drive on the next save
+                print(f"⚠️  Drive upload failed during migration: {e}")
+        
+        legacy_path.replace(legacy_path.with_name(retired_name))
+        print(f"📦 Migrated {legacy_name} → {path.name} ({len(df)} rows)")
+        return True
+    
     # ═══════════════════════════════════════════════════════════════════════
     # METADATA MANAGEMENT
     # ═══════════════════════════════════════════════════════════════════════
@@ -657,9 +837,10 @@ class StorageManager:
             return df
         
         # Add derived columns
-        df['entry_year'] = pd.to_datetime(df['entry_date']).dt.year
-        df['entry_month'] = pd.to_datetime(df['entry_date']).dt.month
-        df['entry_weekday'] = pd.to_datetime(df['entry_date']).dt.day_name()
+        entry_date = pd.to_datetime(df['entry_date'], errors='coerce')
+        df['entry_year'] = entry_date.dt.year
+        df['entry_month'] = entry_date.dt.month
+        df['entry_weekday'] = entry_date.dt.day_name()
         
         if output_path:
             df.to_csv(output_path, index=False)